@@ -121,7 +121,7 @@ fi
 if [ "$RUN_TESTS" = true ]; then
   print_header "Running Tests"
   
-  # Run pytest with anyio
+  # Run pytest (pytest-asyncio and pytest-xdist are configured in pyproject.toml)
   printf "${YELLOW}Running pytest...${NC}\n"
   PYTEST_DISABLE_PLUGIN_AUTOLOAD="" uv run --frozen pytest
   check_result "Pytest" "continue"
@@ -1,8 +1,11 @@
 """WWDCDigest - Tools for creating digests from Apple WWDC sessions."""
 
-# Re-export public API
-from .digest import create_digest
-from .models import WWDCDigest
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .digest import create_digest, create_digests
+    from .models import WWDCDigest
 
 # Version information
 __version__ = "0.1.0"
@@ -10,4 +13,32 @@ __version__ = "0.1.0"
 __all__ = [
     "WWDCDigest",
     "create_digest",
+    "create_digests",
 ]
+
+# Re-export public API lazily so that importing the package (e.g. for the CLI's
+# --help or --version) does not load OpenCV, PIL and the OpenAI client
+_LAZY_EXPORTS = {
+    "WWDCDigest": ".models",
+    "create_digest": ".digest",
+    "create_digests": ".digest",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import a re-exported name on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The re-exported object
+
+    Raises:
+        AttributeError: If name is not part of the public API
+    """
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,57 @@
+"""Shared HTTP client for outgoing API requests."""
+
+import asyncio
+
+import httpx
+from openai import DefaultAsyncHttpxClient
+
+# Connection pool settings for the shared client
+MAX_CONNECTIONS = 64
+KEEPALIVE_EXPIRY_SECONDS = 75
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client of the running event loop.
+
+    Reusing one client keeps TCP/TLS connections alive across requests
+    instead of paying a new handshake for every API call. Pooled connections
+    belong to the loop that opened them, so a client left open by an earlier
+    event loop (such as a previous asyncio.run call) is replaced.
+
+    Returns:
+        The shared httpx.AsyncClient
+
+    Raises:
+        RuntimeError: If called without a running event loop
+    """
+    global _http_client, _http_client_loop  # noqa: PLW0603
+
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client if the running event loop created it.
+
+    A client created by another event loop cannot be closed from this one; it
+    is dropped and its connections are released with that loop.
+    """
+    global _http_client, _http_client_loop  # noqa: PLW0603
+
+    client, owner = _http_client, _http_client_loop
+    _http_client = None
+    _http_client_loop = None
+    if client is not None and owner is asyncio.get_running_loop():
+        await client.aclose()
@@ -1,12 +1,88 @@
 """Translation utilities for WWDC digest."""
 
+import asyncio
 import logging
 
 from .models import OpenAIConfig, WWDCFrameSegment
-from .openai_utils import translate_text
+from .openai_utils import OpenAIResponseError, translate_text, translate_texts
 
 logger = logging.getLogger("wwdcdigest")
 
+# Maximum number of translation requests in flight at once
+MAX_CONCURRENT_TRANSLATIONS = 16
+
+# Number of texts sent per batch request, and batch requests in flight at once
+TRANSLATION_BATCH_SIZE = 40
+MAX_CONCURRENT_BATCHES = 8
+
+
+async def _translate_individually(
+    texts: list[str],
+    language: str,
+    config: OpenAIConfig,
+) -> list[str]:
+    """Translate texts with one concurrent request per text.
+
+    Args:
+        texts: Texts to translate
+        language: Target language code
+        config: OpenAI API configuration
+
+    Returns:
+        Translated texts in the same order as the input
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSLATIONS)
+
+    async def translate(text: str) -> str:
+        async with semaphore:
+            return await translate_text(text, language, config)
+
+    return list(await asyncio.gather(*[translate(text) for text in texts]))
+
+
+async def _translate_in_batches(
+    texts: list[str],
+    language: str,
+    config: OpenAIConfig,
+) -> list[str]:
+    """Translate texts with concurrent batch requests of bounded size.
+
+    A batch whose response cannot be mapped back onto its inputs is translated
+    individually, without affecting the other batches. Other API errors, such
+    as rate limits or connection failures, are raised instead of multiplying
+    the requests.
+
+    Args:
+        texts: Texts to translate
+        language: Target language code
+        config: OpenAI API configuration
+
+    Returns:
+        Translated texts in the same order as the input
+
+    Raises:
+        OpenAIError: If a request fails for any reason other than a batch
+            response that does not match its inputs
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+    async def translate_batch(batch: list[str]) -> list[str]:
+        async with semaphore:
+            try:
+                return await translate_texts(batch, language, config)
+            except OpenAIResponseError as e:
+                logger.warning(
+                    "Batch translation failed, translating individually: %s", e
+                )
+                return await _translate_individually(batch, language, config)
+
+    batches = [
+        texts[i : i + TRANSLATION_BATCH_SIZE]
+        for i in range(0, len(texts), TRANSLATION_BATCH_SIZE)
+    ]
+    results = await asyncio.gather(*[translate_batch(batch) for batch in batches])
+    return [text for batch in results for text in batch]
+
 
 async def translate_digest_content(
     summary: str,
@@ -17,6 +93,11 @@ async def translate_digest_content(
 ) -> tuple[str, list[str], list[WWDCFrameSegment]]:
     """Translate digest content to the target language.
 
+    Blank texts are skipped, identical texts (such as repeated captions) are
+    translated once, and the unique texts are sent in concurrent batch
+    requests. If a batch response cannot be mapped back onto its inputs, that
+    batch is translated individually.
+
     Args:
         summary: Summary text to translate
         key_points: List of key points to translate
@@ -30,19 +111,21 @@ async def translate_digest_content(
         - translated key points
         - segments with translated text
     """
-    logger.info(f"Translating content to {language}")
+    logger.info("Translating content to %s", language)
+
+    texts = [summary, *key_points, *(segment.text for segment in segments)]
+    unique_texts = list(dict.fromkeys(text for text in texts if text.strip()))
+    translated_unique = await _translate_in_batches(unique_texts, language, config)
 
-    # Translate summary
-    translated_summary = await translate_text(summary, language, config)
+    # Blank texts are left as they are
+    translations = dict(zip(unique_texts, translated_unique, strict=True))
+    translated = [translations.get(text, text) for text in texts]
 
-    # Translate key points
-    translated_key_points = []
-    for point in key_points:
-        translated_point = await translate_text(point, language, config)
-        translated_key_points.append(translated_point)
+    translated_summary = translated[0]
+    translated_key_points = translated[1 : 1 + len(key_points)]
 
-    # Translate segment texts (modifies segments in place)
-    for segment in segments:
-        segment.text = await translate_text(segment.text, language, config)
+    # Apply segment translations (modifies segments in place)
+    for segment, text in zip(segments, translated[1 + len(key_points) :], strict=True):
+        segment.text = text
 
     return translated_summary, translated_key_points, segments
@@ -0,0 +1,200 @@
+"""Persistent on-disk cache for translations."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger("wwdcdigest")
+
+CACHE_FILENAME = "translations.sqlite3"
+
+
+def _default_cache_dir() -> str:
+    """Return the directory used for the default translation cache.
+
+    Returns:
+        WWDCDIGEST_CACHE_DIR if set, otherwise the wwdcdigest directory under
+        XDG_CACHE_HOME (defaulting to ~/.cache)
+    """
+    if cache_dir := os.environ.get("WWDCDIGEST_CACHE_DIR"):
+        return cache_dir
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "wwdcdigest")
+
+
+class TranslationCache:
+    """SQLite-backed cache of translated texts.
+
+    Entries are keyed by text, language, model and API endpoint. The
+    connection may be used from worker threads, so callers on the event loop
+    can run lookups through asyncio.to_thread; a lock serializes access.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "hash TEXT PRIMARY KEY, lang TEXT, model TEXT, response TEXT, ts INTEGER)"
+        )
+
+    @staticmethod
+    def key(text: str, language: str, model: str, endpoint: str | None = None) -> str:
+        """Compute the cache key for a translation.
+
+        Args:
+            text: The source text
+            language: The target language code
+            model: The model used for translation
+            endpoint: The API endpoint used for translation (None for the default)
+
+        Returns:
+            Hex digest identifying the translation
+        """
+        return hashlib.blake2b(
+            f"{endpoint or ''}|{model}|{language}|{text}".encode(), digest_size=16
+        ).hexdigest()
+
+    def get(
+        self, text: str, language: str, model: str, endpoint: str | None = None
+    ) -> str | None:
+        """Look up a cached translation.
+
+        Args:
+            text: The source text
+            language: The target language code
+            model: The model used for translation
+            endpoint: The API endpoint used for translation (None for the default)
+
+        Returns:
+            The cached translation, or None if not cached
+        """
+        return self.get_many([text], language, model, endpoint)[0]
+
+    def get_many(
+        self,
+        texts: list[str],
+        language: str,
+        model: str,
+        endpoint: str | None = None,
+    ) -> list[str | None]:
+        """Look up cached translations of several texts.
+
+        Args:
+            texts: The source texts
+            language: The target language code
+            model: The model used for translation
+            endpoint: The API endpoint used for translation (None for the default)
+
+        Returns:
+            The cached translation of each text, or None where not cached
+        """
+        with self._lock:
+            rows = [
+                self._connection.execute(
+                    "SELECT response FROM cache WHERE hash = ?",
+                    (self.key(text, language, model, endpoint),),
+                ).fetchone()
+                for text in texts
+            ]
+        return [row[0] if row else None for row in rows]
+
+    def set(
+        self,
+        text: str,
+        language: str,
+        model: str,
+        translation: str,
+        endpoint: str | None = None,
+    ) -> None:
+        """Store a translation in the cache.
+
+        Args:
+            text: The source text
+            language: The target language code
+            model: The model used for translation
+            translation: The translated text
+            endpoint: The API endpoint used for translation (None for the default)
+        """
+        self.set_many({text: translation}, language, model, endpoint)
+
+    def set_many(
+        self,
+        translations: dict[str, str],
+        language: str,
+        model: str,
+        endpoint: str | None = None,
+    ) -> None:
+        """Store several translations in the cache in one transaction.
+
+        Args:
+            translations: Translated text of each source text
+            language: The target language code
+            model: The model used for translation
+            endpoint: The API endpoint used for translation (None for the default)
+        """
+        ts = int(time.time())
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO cache (hash, lang, model, response, ts) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            self.key(text, language, model, endpoint),
+                            language,
+                            model,
+                            translation,
+                            ts,
+                        )
+                        for text, translation in translations.items()
+                    ],
+                )
+            except sqlite3.Error:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+_default_cache: TranslationCache | None = None
+_default_cache_failed = False
+
+
+def get_translation_cache() -> TranslationCache | None:
+    """Return the shared translation cache, opening it on first use.
+
+    Returns:
+        The shared TranslationCache, or None if the cache could not be opened
+    """
+    global _default_cache, _default_cache_failed  # noqa: PLW0603
+
+    if _default_cache is None and not _default_cache_failed:
+        cache_dir = _default_cache_dir()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            _default_cache = TranslationCache(os.path.join(cache_dir, CACHE_FILENAME))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Translation cache disabled: %s", e)
+            _default_cache_failed = True
+
+    return _default_cache
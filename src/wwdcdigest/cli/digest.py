@@ -8,9 +8,6 @@ from typing import Literal, cast
 
 import click
 
-from wwdcdigest.digest import create_digest
-from wwdcdigest.models import AIConfig, DigestOptions, ImageOptions, OpenAIConfig
-
 AIProvider = Literal["none", "openai", "codex", "claude", "command"]
 
 logger = logging.getLogger("wwdcdigest")
@@ -89,7 +86,7 @@ logger = logging.getLogger("wwdcdigest")
     "--image-format",
     "-i",
     type=click.Choice(["jpg", "png", "avif", "webp"]),
-    default="jpg",
+    default="avif",
     help="Format for extracted images (jpg, png, avif, webp)",
 )
 @click.option(
@@ -127,6 +124,17 @@ def digest_command(  # noqa: PLR0913
     (e.g., 'https://developer.apple.com/videos/play/wwdc2023/110173/'
     or 'https://developer.apple.com/jp/videos/play/wwdc2023/110173/')
     """
+    # Imported here so that --help does not pay for the full import graph
+    from wwdcdigest._http import close_http_client
+    from wwdcdigest.digest import create_digest
+    from wwdcdigest.models import (
+        AIConfig,
+        DigestOptions,
+        ImageOptions,
+        OpenAIConfig,
+        WWDCDigest,
+    )
+
     try:
         if output_format != "markdown":
             raise ValueError("Currently, only 'markdown' format is supported.")
@@ -170,13 +178,15 @@ def digest_command(  # noqa: PLR0913
             force_regenerate=force,
         )
 
-        digest = asyncio.run(
-            create_digest(
-                url=url,
-                options=digest_options,
-            )
-        )
-        logger.info(f"Successfully created digest for session {digest.session.id}")
+        async def run() -> WWDCDigest:
+            try:
+                return await create_digest(url=url, options=digest_options)
+            finally:
+                # Release pooled connections before the event loop goes away
+                await close_http_client()
+
+        digest = asyncio.run(run())
+        logger.info("Successfully created digest for session %s", digest.session.id)
 
         # Print output path
         click.echo(f"Digest created: {digest.markdown_path}")
@@ -185,5 +195,5 @@ def digest_command(  # noqa: PLR0913
             click.echo("Open the file to view the digest with embedded frames.")
 
     except Exception as e:
-        logger.error(f"Error creating digest: {e}")
+        logger.error("Error creating digest: %s", e)
         sys.exit(1)
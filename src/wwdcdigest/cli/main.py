@@ -5,7 +5,6 @@ import logging
 import click
 
 from wwdcdigest import __version__
-from wwdcdigest.logger import setup_logger
 
 from .digest import digest_command
 
@@ -29,6 +28,9 @@ def main(verbose: bool, quiet: bool, log_file: str | None) -> None:
 
     Run a subcommand with --help to see specific options for that command.
     """
+    # Imported here so that --help and --version do not load rich
+    from wwdcdigest.logger import setup_logger
+
     # Set up logging
     log_level = logging.WARNING
     if verbose:
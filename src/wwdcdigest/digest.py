@@ -5,17 +5,29 @@ Environment variables:
     OPENAI_API_ENDPOINT: Custom OpenAI API endpoint URL (optional)
     CODEX_API_KEY: API key used by Codex CLI in non-interactive mode (optional)
     ANTHROPIC_API_KEY: API key used by Claude Code in bare mode (optional)
+    WWDCDIGEST_CACHE_DIR: Directory for the translation cache (optional,
+        defaults to $XDG_CACHE_HOME/wwdcdigest)
+    WWDCDIGEST_USE_SHM: Set to 1 to create temporary output directories on
+        /dev/shm when it has enough free space (optional)
 """
 
+import asyncio
 import logging
 import os
+import re
+import shutil
 import tempfile
+from dataclasses import dataclass
+from pathlib import Path
 
+from pydantic import TypeAdapter, ValidationError
 from wwdctools.downloader import download_session_content
 from wwdctools.models import WWDCSession
 from wwdctools.session import fetch_session_data
 
+from ._http import close_http_client
 from .factory import DigestComponentFactory
+from .interfaces import ContentSummarizer
 from .models import (
     AIConfig,
     DigestOptions,
@@ -27,6 +39,50 @@ from .models import (
 
 logger = logging.getLogger("wwdcdigest")
 
+# Sidecar file caching the extracted segments of a session
+SEGMENTS_FILENAME = "segments.json"
+
+# Manifest recording the downloaded content of a session and its mtimes
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_CONTENT_TYPES = ("video", "webvtt", "transcript")
+
+_segments_adapter = TypeAdapter(list[WWDCFrameSegment])
+_manifest_adapter = TypeAdapter(dict[str, tuple[str, int]])
+
+# RAM-backed directory used for temporary output when WWDCDIGEST_USE_SHM is
+# set, and the free space it needs to hold a session's video and frames
+SHM_DIR = "/dev/shm"
+MIN_SHM_FREE_BYTES = 4 * 1024**3
+USE_SHM_ENV = "WWDCDIGEST_USE_SHM"
+
+# Transcripts longer than this are summarized chunk by chunk and then merged,
+# with at most MAX_CONCURRENT_SUMMARIES chunk requests in flight at once
+TRANSCRIPT_CHUNK_CHARS = 24000
+MAX_CONCURRENT_SUMMARIES = 4
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Number of sessions create_digests processes at once by default
+DEFAULT_DIGEST_CONCURRENCY = 4
+
+# Apple Developer video URLs of any collection (wwdc2024, tech-talks, ...),
+# optionally with a localized path prefix such as /jp
+_WWDC_URL_RE = re.compile(
+    r"^https?://developer\.apple\.com(?:/[a-z]{2})?/videos/play/[^/]+/\d+/?"
+)
+
+
+def _read_text(path: str) -> str:
+    """Read a UTF-8 text file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Contents of the file
+    """
+    return Path(path).read_text(encoding="utf-8")
+
 
 async def _get_transcript_from_session(
     download_paths: dict[str, str], segments: list[WWDCFrameSegment]
@@ -44,20 +100,12 @@ async def _get_transcript_from_session(
     if "transcript" in download_paths:
         transcript_path = download_paths["transcript"]
         try:
-            with open(transcript_path, encoding="utf-8") as f:
-                return f.read()
-        except Exception as e:
-            logger.error(f"Error reading transcript file: {e}")
+            return await asyncio.to_thread(_read_text, transcript_path)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error("Error reading transcript file: %s", e)
 
     # If no transcript, build one from WebVTT segments
-    if segments:
-        try:
-            captions_text = [segment.text for segment in segments]
-            return "\n".join(captions_text)
-        except Exception as e:
-            logger.error(f"Error creating transcript from captions: {e}")
-
-    return ""
+    return "\n".join(segment.text for segment in segments)
 
 
 def _validate_openai_settings(
@@ -76,25 +124,10 @@ def _validate_openai_settings(
     Raises:
         ValueError: If non-English language is requested but no OpenAI key is available
     """
-    api_key = None
-    endpoint = None
-
-    # If config is provided, use it
-    if config:
-        api_key = config.api_key
-        endpoint = config.endpoint
-
-    # Check for OpenAI API key in environment if not provided
-    if not api_key:
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if api_key:
-            logger.debug("Using OpenAI API key from environment")
-
-    # Check for OpenAI API endpoint in environment if not provided
-    if not endpoint:
-        endpoint = os.environ.get("OPENAI_API_ENDPOINT")
-        if endpoint:
-            logger.debug("Using OpenAI API endpoint from environment")
+    # Values from the config take precedence over the environment
+    env = os.environ
+    api_key = (config.api_key if config else None) or env.get("OPENAI_API_KEY")
+    endpoint = (config.endpoint if config else None) or env.get("OPENAI_API_ENDPOINT")
 
     # Check if translation is needed but no OpenAI key is available
     if language != "en" and not api_key:
@@ -183,9 +216,85 @@ def _validate_ai_settings(
     return config
 
 
+@dataclass(frozen=True, slots=True)
+class SessionPaths:
+    """Paths of the files and directories for one session's output."""
+
+    session_dir: str
+    frames: str
+    video: str
+    webvtt: str
+    transcript: str
+    sample_code: str
+    segments_json: str
+    manifest: str
+    nested_download_dir: str
+
+    @classmethod
+    def for_session(cls, session_dir: str, session: WWDCSession) -> "SessionPaths":
+        """Build the paths for a session directory.
+
+        Args:
+            session_dir: Directory for session files
+            session: WWDCSession object
+
+        Returns:
+            SessionPaths rooted at session_dir
+        """
+        return cls(
+            session_dir=session_dir,
+            frames=os.path.join(session_dir, "frames"),
+            video=os.path.join(session_dir, "hd.mp4"),
+            webvtt=os.path.join(session_dir, "webvtt"),
+            transcript=os.path.join(session_dir, "transcript.txt"),
+            sample_code=os.path.join(session_dir, "sample_code.md"),
+            segments_json=os.path.join(session_dir, SEGMENTS_FILENAME),
+            manifest=os.path.join(session_dir, MANIFEST_FILENAME),
+            # The downloader may nest content in a directory named like ours
+            nested_download_dir=os.path.join(
+                session_dir, f"wwdc_{session.year}_{session.id}"
+            ),
+        )
+
+
+def _temp_output_parent() -> str | None:
+    """Choose the parent directory for a temporary output directory.
+
+    Returns:
+        SHM_DIR if WWDCDIGEST_USE_SHM is enabled and SHM_DIR is a directory
+        with enough free space, otherwise None to use the default temporary
+        directory
+    """
+    if os.environ.get(USE_SHM_ENV, "").lower() not in ("1", "true", "yes"):
+        return None
+    if not os.path.isdir(SHM_DIR):
+        return None
+    try:
+        if shutil.disk_usage(SHM_DIR).free < MIN_SHM_FREE_BYTES:
+            return None
+    except OSError:
+        return None
+    return SHM_DIR
+
+
+def _make_temp_output_dir() -> str:
+    """Create a temporary output directory.
+
+    Returns:
+        Path to the new directory, under SHM_DIR when it is enabled and
+        writable, otherwise under the default temporary directory
+    """
+    if parent := _temp_output_parent():
+        try:
+            return tempfile.mkdtemp(prefix="wwdcdigest_", dir=parent)
+        except OSError as e:
+            logger.warning("Cannot create output directory in %s: %s", parent, e)
+    return tempfile.mkdtemp(prefix="wwdcdigest_")
+
+
 def _setup_output_directory(
     output_dir: str | None, session: WWDCSession
-) -> tuple[str, str, str, str]:
+) -> tuple[SessionPaths, str]:
     """Set up output directories.
 
     Args:
@@ -193,39 +302,39 @@ def _setup_output_directory(
         session: WWDCSession object
 
     Returns:
-        Tuple of (output_dir, session_dir, frames_dir, markdown_path)
+        Tuple of (session paths, existing markdown path or empty string)
     """
-    # Create temporary directory if output_dir not specified
+    # Create temporary directory if output_dir not specified, in RAM when
+    # enabled so writing the downloaded video and frames avoids disk I/O
     if not output_dir:
-        output_dir = tempfile.mkdtemp(prefix="wwdcdigest_")
+        output_dir = _make_temp_output_dir()
     else:
         os.makedirs(output_dir, exist_ok=True)
 
-    logger.debug(f"Using output directory: {output_dir}")
+    logger.debug("Using output directory: %s", output_dir)
 
     # Create subdirectory for session in the format wwdc_YEAR_ID
     session_dir = os.path.join(output_dir, f"wwdc_{session.year}_{session.id}")
     os.makedirs(session_dir, exist_ok=True)
+    paths = SessionPaths.for_session(session_dir, session)
 
     # Create frames directory
-    frames_dir = os.path.join(session_dir, "frames")
-    os.makedirs(frames_dir, exist_ok=True)
+    os.makedirs(paths.frames, exist_ok=True)
 
     # Check if markdown file already exists in session directory
     markdown_path = ""
-    for file in os.listdir(session_dir):
-        if file.endswith(".md") and not file.startswith("sample_code"):
-            markdown_path = os.path.join(session_dir, file)
-            logger.debug(f"Found existing markdown file: {markdown_path}")
-            break
+    with os.scandir(session_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md") and not entry.name.startswith("sample_code"):
+                markdown_path = entry.path
+                logger.debug("Found existing markdown file: %s", markdown_path)
+                break
 
-    return output_dir, session_dir, frames_dir, markdown_path
+    return paths, markdown_path
 
 
-async def _handle_file_move(
-    old_path: str, expected_path: str, is_dir: bool = False
-) -> str:
-    """Handle moving a file or directory to its expected location.
+def _move_path(old_path: str, expected_path: str, is_dir: bool) -> str:
+    """Move a file or directory to its expected location (blocking).
 
     Args:
         old_path: Current path of the file/directory
@@ -235,33 +344,56 @@ async def _handle_file_move(
     Returns:
         Final path of the file/directory
     """
-    if old_path == expected_path or not os.path.exists(old_path):
+    if old_path == expected_path:
         return old_path
 
-    if is_dir and os.path.exists(expected_path):
-        # If directory exists, move contents
-        for file in os.listdir(old_path):
-            os.rename(
-                os.path.join(old_path, file),
-                os.path.join(expected_path, file),
-            )
+    try:
+        # A single atomic replace covers files (overwriting any existing one)
+        # and directories whose target is missing or an empty directory
+        os.replace(old_path, expected_path)
+    except FileNotFoundError:
+        return old_path
+    except OSError:
+        if not is_dir:
+            raise
+
+        # The target directory already has content, so move entries into it
+        with os.scandir(old_path) as entries:
+            for entry in entries:
+                os.replace(entry.path, os.path.join(expected_path, entry.name))
         os.rmdir(old_path)
-    else:
-        # Simple rename for files or non-existent target directories
-        os.rename(old_path, expected_path)
 
     return expected_path
 
 
+async def _handle_file_move(
+    old_path: str, expected_path: str, is_dir: bool = False
+) -> str:
+    """Handle moving a file or directory to its expected location.
+
+    The filesystem work runs in a worker thread so it doesn't block the
+    event loop.
+
+    Args:
+        old_path: Current path of the file/directory
+        expected_path: Target path for the file/directory
+        is_dir: Whether the path is a directory
+
+    Returns:
+        Final path of the file/directory
+    """
+    return await asyncio.to_thread(_move_path, old_path, expected_path, is_dir)
+
+
 async def _organize_downloaded_content(
     temp_download_paths: dict[str, str],
-    session_dir: str,
+    paths: SessionPaths,
 ) -> dict[str, str]:
     """Organize downloaded content into standardized paths.
 
     Args:
         temp_download_paths: Dictionary of temporary download paths
-        session_dir: Directory for session files
+        paths: Paths for the session's output
 
     Returns:
         Dictionary of final download paths
@@ -270,10 +402,10 @@ async def _organize_downloaded_content(
 
     # Define expected paths
     expected_paths = {
-        "video": os.path.join(session_dir, "hd.mp4"),
-        "webvtt": os.path.join(session_dir, "webvtt"),
-        "transcript": os.path.join(session_dir, "transcript.txt"),
-        "sample_code": os.path.join(session_dir, "sample_code.md"),
+        "video": paths.video,
+        "webvtt": paths.webvtt,
+        "transcript": paths.transcript,
+        "sample_code": paths.sample_code,
     }
 
     # Process each content type
@@ -288,76 +420,233 @@ async def _organize_downloaded_content(
     return download_paths
 
 
+def _has_entries(directory: str, suffix: str = "") -> bool:
+    """Check whether a directory contains an entry with the given suffix.
+
+    Stops at the first match, so large directories are not read in full.
+
+    Args:
+        directory: Directory to check
+        suffix: Required file name suffix (any entry matches if empty)
+
+    Returns:
+        True if a matching entry is found, False otherwise
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name.endswith(suffix) for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _stat_existing_content(paths: SessionPaths) -> tuple[bool, bool, bool, bool]:
+    """Check which content files already exist on disk (blocking).
+
+    Args:
+        paths: Paths for the session's output
+
+    Returns:
+        Tuple of (video exists, WebVTT exists, transcript exists, frames exist)
+    """
+    # One pass over the session directory; scandir entries know their file
+    # type without an extra stat on most platforms
+    files: set[str] = set()
+    try:
+        with os.scandir(paths.session_dir) as entries:
+            files = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        pass
+
+    video_exists = os.path.basename(paths.video) in files
+    webvtt_exists = _has_entries(paths.webvtt, ".webvtt")
+    transcript_exists = os.path.basename(paths.transcript) in files
+    frames_exist = _has_entries(paths.frames)
+    return video_exists, webvtt_exists, transcript_exists, frames_exist
+
+
+def _save_manifest(path: str, download_paths: dict[str, str]) -> None:
+    """Record downloaded content and its modification times (blocking).
+
+    Args:
+        path: Path to the manifest file
+        download_paths: Dictionary of final download paths
+    """
+    try:
+        manifest = {
+            content_type: (
+                download_paths[content_type],
+                os.stat(download_paths[content_type]).st_mtime_ns,
+            )
+            for content_type in MANIFEST_CONTENT_TYPES
+            if content_type in download_paths
+        }
+        Path(path).write_bytes(_manifest_adapter.dump_json(manifest))
+    except OSError as e:
+        logger.warning("Could not write manifest %s: %s", path, e)
+
+
+def _load_manifest(path: str) -> dict[str, str] | None:
+    """Load download paths from a manifest if the content is unchanged (blocking).
+
+    Args:
+        path: Path to the manifest file
+
+    Returns:
+        Dictionary of download paths, or None if the manifest is missing,
+        invalid or any recorded file has been modified or removed
+    """
+    try:
+        manifest = _manifest_adapter.validate_json(Path(path).read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as e:
+        logger.warning("Ignoring invalid manifest %s: %s", path, e)
+        return None
+
+    if "video" not in manifest or "webvtt" not in manifest:
+        return None
+
+    for content_path, mtime_ns in manifest.values():
+        try:
+            if os.stat(content_path).st_mtime_ns != mtime_ns:
+                return None
+        except OSError:
+            return None
+
+    return {content_type: entry[0] for content_type, entry in manifest.items()}
+
+
+def _find_existing_content(paths: SessionPaths) -> tuple[dict[str, str], bool]:
+    """Find previously downloaded content and frames (blocking).
+
+    Args:
+        paths: Paths for the session's output
+
+    Returns:
+        Tuple of (existing file paths, frames exist flag)
+    """
+    # A valid manifest saves scanning the session and WebVTT directories
+    download_paths = _load_manifest(paths.manifest)
+    if download_paths is not None:
+        return download_paths, _has_entries(paths.frames)
+
+    (
+        video_exists,
+        webvtt_exists,
+        transcript_exists,
+        frames_exist,
+    ) = _stat_existing_content(paths)
+
+    download_paths = {}
+    if video_exists and webvtt_exists:
+        download_paths = {
+            "video": paths.video,
+            "webvtt": paths.webvtt,
+        }
+
+        # Add transcript if it exists
+        if transcript_exists:
+            download_paths["transcript"] = paths.transcript
+
+    return download_paths, frames_exist
+
+
 async def _check_existing_content(
     session: WWDCSession,
-    session_dir: str,
-    frames_dir: str,
+    paths: SessionPaths,
 ) -> tuple[dict[str, str], bool]:
     """Check for existing content files.
 
     Args:
         session: WWDCSession object
-        session_dir: Directory for session files
-        frames_dir: Directory for extracted frames
+        paths: Paths for the session's output
 
     Returns:
         Tuple of (existing file paths, frames exist flag)
     """
-    expected_video_path = os.path.join(session_dir, "hd.mp4")
-    expected_webvtt_dir = os.path.join(session_dir, "webvtt")
-    expected_transcript_path = os.path.join(session_dir, "transcript.txt")
-
-    # Check if required files exist
-    video_exists = os.path.isfile(expected_video_path)
-    webvtt_exists = os.path.isdir(expected_webvtt_dir) and any(
-        f.endswith(".webvtt") for f in os.listdir(expected_webvtt_dir)
+    download_paths, frames_exist = await asyncio.to_thread(
+        _find_existing_content, paths
     )
 
-    # Check if frames already exist
-    frames_exist = os.path.isdir(frames_dir) and any(os.listdir(frames_dir))
-
-    # Prepare result
-    download_paths = {}
-
-    if video_exists and webvtt_exists:
+    if download_paths:
         logger.info(
-            f"Video and WebVTT files already exist for session {session.id}, "
-            "skipping download"
+            "Video and WebVTT files already exist for session %s, skipping download",
+            session.id,
         )
 
-        download_paths = {
-            "video": expected_video_path,
-            "webvtt": expected_webvtt_dir,
-        }
-
-        # Add transcript if it exists
-        if os.path.isfile(expected_transcript_path):
-            download_paths["transcript"] = expected_transcript_path
-
     if frames_exist:
         logger.info(
-            f"Frames already exist for session {session.id}, skipping extraction"
+            "Frames already exist for session %s, skipping extraction", session.id
         )
 
     return download_paths, frames_exist
 
 
-async def _download_and_extract_frames(
-    session_data: WWDCSession,
+def _flatten_nested_directory(
+    nested_dir_path: str,
     session_dir: str,
-    frames_dir: str,
-    image_options: ImageOptions,
-) -> tuple[dict[str, str], list[WWDCFrameSegment]]:
-    """Download session content and extract frames.
+    download_paths: dict[str, str],
+) -> None:
+    """Move files from a nested session directory into its parent (blocking).
 
     Args:
-        session_data: Session data
+        nested_dir_path: Nested directory created by the downloader
         session_dir: Directory for session files
-        frames_dir: Directory for extracted frames
-        image_options: Options for image extraction and formatting
+        download_paths: Download paths, updated in place for moved files
+    """
+    if not os.path.isdir(nested_dir_path):
+        return
+
+    logger.info("Fixing nested directory structure: %s", nested_dir_path)
+
+    # Index the download paths so moved files are looked up in O(1)
+    keys_by_path: dict[str, list[str]] = {}
+    for key, path in download_paths.items():
+        keys_by_path.setdefault(path, []).append(key)
+
+    # Move all files from nested directory to parent
+    with os.scandir(nested_dir_path) as entries:
+        for entry in entries:
+            source_path = entry.path
+            target_path = os.path.join(session_dir, entry.name)
+
+            # Skip if the file already exists in the target location
+            if os.path.exists(target_path):
+                logger.debug("File already exists in parent directory: %s", target_path)
+                os.remove(source_path)
+                continue
+
+            # Move the file
+            logger.debug("Moving %s to %s", source_path, target_path)
+            os.rename(source_path, target_path)
+
+            # Update path in download_paths if it matches
+            for key in keys_by_path.get(source_path, ()):
+                download_paths[key] = target_path
+                logger.debug("Updated path for %s: %s", key, target_path)
+
+    # Every entry was moved or removed, so the nested directory is now empty
+    try:
+        os.rmdir(nested_dir_path)
+        logger.info("Removed empty nested directory: %s", nested_dir_path)
+    except OSError:
+        logger.warning(
+            "Nested directory not empty after processing: %s", nested_dir_path
+        )
+
+
+async def _download_content(
+    session_data: WWDCSession,
+    paths: SessionPaths,
+) -> tuple[dict[str, str], bool]:
+    """Download session content unless it already exists.
+
+    Args:
+        session_data: Session data
+        paths: Paths for the session's output
 
     Returns:
-        Tuple of (download_paths, segments)
+        Tuple of (download_paths, frames_exist)
 
     Raises:
         ValueError: If required files are not available
@@ -365,93 +654,207 @@ async def _download_and_extract_frames(
     session_id = session_data.id
 
     # Check for existing content
-    download_paths, frames_exist = await _check_existing_content(
-        session_data, session_dir, frames_dir
-    )
+    download_paths, frames_exist = await _check_existing_content(session_data, paths)
 
     if not download_paths:
         # Download content (video, transcript, WebVTT)
-        logger.info(f"Downloading content for session {session_id}")
+        logger.info("Downloading content for session %s", session_id)
         temp_download_paths = await download_session_content(
-            session_data, session_dir, "hd"
+            session_data, paths.session_dir, "hd"
         )
 
         # Fix nested directory structure if it exists
-        nested_dir_path = os.path.join(
-            session_dir, f"wwdc_{session_data.year}_{session_id}"
-        )
-        if os.path.exists(nested_dir_path) and os.path.isdir(nested_dir_path):
-            logger.info(f"Fixing nested directory structure: {nested_dir_path}")
-
-            # Move all files from nested directory to parent
-            for filename in os.listdir(nested_dir_path):
-                source_path = os.path.join(nested_dir_path, filename)
-                target_path = os.path.join(session_dir, filename)
-
-                # Skip if the file already exists in the target location
-                if os.path.exists(target_path):
-                    logger.debug(
-                        f"File already exists in parent directory: {target_path}"
-                    )
-                    os.remove(source_path)
-                    continue
-
-                # Move the file
-                logger.debug(f"Moving {source_path} to {target_path}")
-                os.rename(source_path, target_path)
-
-                # Update path in temp_download_paths if it matches
-                for key, path in temp_download_paths.items():
-                    if path == source_path:
-                        temp_download_paths[key] = target_path
-                        logger.debug(f"Updated path for {key}: {target_path}")
-
-            # Remove the nested directory if it's now empty
-            if not os.listdir(nested_dir_path):
-                logger.info(f"Removing empty nested directory: {nested_dir_path}")
-                os.rmdir(nested_dir_path)
-            else:
-                logger.warning(
-                    f"Nested directory not empty after processing: {nested_dir_path}"
-                )
-
-        download_paths = await _organize_downloaded_content(
+        await asyncio.to_thread(
+            _flatten_nested_directory,
+            paths.nested_download_dir,
+            paths.session_dir,
             temp_download_paths,
-            session_dir,
         )
 
+        download_paths = await _organize_downloaded_content(temp_download_paths, paths)
+
+        # Record the content so reruns can skip scanning the directories
+        if "video" in download_paths and "webvtt" in download_paths:
+            await asyncio.to_thread(_save_manifest, paths.manifest, download_paths)
+
     # Check if required files are available
     if "video" not in download_paths or "webvtt" not in download_paths:
         logger.error("Video or WebVTT files not available")
         raise ValueError("Video or WebVTT files not available for this session")
 
+    return download_paths, frames_exist
+
+
+def _load_segments_sidecar(path: str) -> list[WWDCFrameSegment] | None:
+    """Load segments from a sidecar file written by a previous run (blocking).
+
+    Args:
+        path: Path to the segments sidecar file
+
+    Returns:
+        The cached segments, or None if the sidecar is missing, invalid or
+        refers to frame images that no longer exist
+    """
+    try:
+        segments = _segments_adapter.validate_json(Path(path).read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as e:
+        logger.warning("Ignoring invalid segments file %s: %s", path, e)
+        return None
+
+    if not all(os.path.isfile(segment.image_path) for segment in segments):
+        logger.info("Segments file %s refers to missing frames, ignoring it", path)
+        return None
+
+    return segments
+
+
+def _save_segments_sidecar(path: str, segments: list[WWDCFrameSegment]) -> None:
+    """Write segments to a sidecar file so later runs can reuse them (blocking).
+
+    Args:
+        path: Path to the segments sidecar file
+        segments: Segments to save
+    """
+    try:
+        Path(path).write_bytes(_segments_adapter.dump_json(segments))
+    except OSError as e:
+        logger.warning("Could not write segments file %s: %s", path, e)
+
+
+async def _extract_segments(
+    download_paths: dict[str, str],
+    paths: SessionPaths,
+    frames_exist: bool,
+    image_options: ImageOptions,
+) -> list[WWDCFrameSegment]:
+    """Extract frames from the downloaded video, or load previously extracted ones.
+
+    Args:
+        download_paths: Dictionary of downloaded file paths
+        paths: Paths for the session's output
+        frames_exist: Whether frames were already extracted to the frames directory
+        image_options: Options for image extraction and formatting
+
+    Returns:
+        List of WWDCFrameSegment objects
+    """
+    segments_path = paths.segments_json
+    frames_dir = paths.frames
+
+    # Reuse the segments saved by a previous run without touching the frames
+    if frames_exist:
+        cached_segments = await asyncio.to_thread(_load_segments_sidecar, segments_path)
+        if cached_segments is not None:
+            logger.info("Loaded %s frames from %s", len(cached_segments), segments_path)
+            return cached_segments
+
     # Create the video processor once
     video_processor = DigestComponentFactory.create_video_processor()
 
     # If frames already exist, load segments from frames directory
     segments = []
     if frames_exist:
-        logger.info(f"Loading existing frames from {frames_dir}")
+        logger.info("Loading existing frames from %s", frames_dir)
         segments = await video_processor.load_segments_from_frames(frames_dir)
-        logger.info(f"Loaded {len(segments)} frames")
+        logger.info("Loaded %s frames", len(segments))
     else:
         # Extract frames using the VideoProcessor abstraction
-        logger.info(f"Extracting frames from video to {frames_dir}")
+        logger.info("Extracting frames from video to %s", frames_dir)
         segments = await video_processor.extract_frames(
             download_paths["video"],
             download_paths["webvtt"],
             frames_dir,
             image_options,
         )
-        logger.info(f"Extracted {len(segments)} frames from video")
+        logger.info("Extracted %s frames from video", len(segments))
+        await asyncio.to_thread(_save_segments_sidecar, segments_path, segments)
+
+    return segments
+
+
+def _chunk_transcript(text: str, max_chars: int = TRANSCRIPT_CHUNK_CHARS) -> list[str]:
+    """Split a transcript into chunks of at most max_chars characters.
+
+    Chunks are split at line boundaries, and overly long lines at sentence
+    boundaries, so no sentence is cut in half. A single sentence longer than
+    max_chars becomes a chunk of its own.
+
+    Args:
+        text: Transcript text
+        max_chars: Maximum number of characters per chunk
+
+    Returns:
+        List of transcript chunks
+    """
+    pieces: list[str] = []
+    for line in text.splitlines():
+        if len(line) > max_chars:
+            pieces.extend(_SENTENCE_END_RE.split(line))
+        elif line.strip():
+            pieces.append(line)
+
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for piece in pieces:
+        if current and size + len(piece) > max_chars:
+            chunks.append("\n".join(current))
+            current = []
+            size = 0
+        current.append(piece)
+        size += len(piece) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+async def _summarize_transcript(
+    summarizer: ContentSummarizer,
+    transcript_text: str,
+    session_title: str,
+    language: str,
+) -> tuple[str, list[str]]:
+    """Summarize a transcript, using map-reduce for long transcripts.
+
+    Transcripts that fit in one chunk are summarized directly. Longer ones are
+    summarized chunk by chunk concurrently, and the partial summaries and key
+    points are then merged with one more summarization request.
+
+    Args:
+        summarizer: Summarizer for the configured AI backend
+        transcript_text: Transcript text
+        session_title: Session title
+        language: Language code for the output
+
+    Returns:
+        Tuple of (summary, key_points)
+    """
+    chunks = _chunk_transcript(transcript_text)
+    if len(chunks) <= 1:
+        return await summarizer.generate_summary(
+            transcript_text, session_title, language
+        )
 
-    return download_paths, segments
+    logger.info("Summarizing transcript in %d chunks", len(chunks))
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+
+    async def summarize(chunk: str) -> tuple[str, list[str]]:
+        async with semaphore:
+            return await summarizer.generate_summary(chunk, session_title, language)
+
+    partials = await asyncio.gather(*[summarize(chunk) for chunk in chunks])
+    merged = "\n\n".join(
+        "\n".join([summary, *(f"- {point}" for point in key_points)])
+        for summary, key_points in partials
+    )
+    return await summarizer.generate_summary(merged, session_title, language)
 
 
 async def _generate_summary_and_key_points(
     config: AIConfig | None,
-    download_paths: dict[str, str],
-    segments: list[WWDCFrameSegment],
+    transcript_text: str,
     session_title: str,
     language: str = "en",
 ) -> tuple[str, list[str]]:
@@ -459,8 +862,8 @@ async def _generate_summary_and_key_points(
 
     Args:
         config: AI configuration
-        download_paths: Dictionary of downloaded file paths
-        segments: List of WWDCFrameSegment objects
+        transcript_text: Transcript text, or the segment texts when the
+            session has no transcript
         session_title: Session title
         language: Language code for the output (defaults to English)
 
@@ -473,8 +876,6 @@ async def _generate_summary_and_key_points(
 
     # Generate summary and key points if an AI backend is configured
     if config:
-        transcript_text = await _get_transcript_from_session(download_paths, segments)
-
         if not transcript_text:
             logger.warning("No transcript available for summary generation")
             return summary, key_points
@@ -482,11 +883,11 @@ async def _generate_summary_and_key_points(
         logger.info("Generating summary and key points with %s", config.provider)
         try:
             summarizer = DigestComponentFactory.create_summarizer(config)
-            summary, key_points = await summarizer.generate_summary(
-                transcript_text, session_title, language
+            summary, key_points = await _summarize_transcript(
+                summarizer, transcript_text, session_title, language
             )
         except Exception as e:
-            logger.error(f"Error generating summary with AI backend: {e}")
+            logger.error("Error generating summary with AI backend: %s", e)
     else:
         logger.info("No AI backend configured, skipping summary and key points")
 
@@ -526,10 +927,32 @@ async def _translate_content_if_needed(
         ) = await translator.translate(summary, key_points, segments, language)
         return translated_summary, translated_key_points, translated_segments
     except Exception as e:
-        logger.error(f"Error translating content: {e}")
+        logger.error("Error translating content: %s", e)
         return summary, key_points, segments
 
 
+async def _extract_and_translate_segments(
+    extraction_task: asyncio.Task[list[WWDCFrameSegment]],
+    language: str,
+    config: AIConfig | None,
+) -> list[WWDCFrameSegment]:
+    """Wait for frame extraction, then translate the segment texts if needed.
+
+    Args:
+        extraction_task: Task extracting the segments
+        language: Language code for the output
+        config: AI configuration
+
+    Returns:
+        List of (translated) WWDCFrameSegment objects
+    """
+    segments = await extraction_task
+    _, _, segments = await _translate_content_if_needed(
+        language, config, segments, "", []
+    )
+    return segments
+
+
 async def create_digest_from_url(
     url: str,
     options: DigestOptions,
@@ -544,7 +967,7 @@ async def create_digest_from_url(
     Returns:
         A digest of the session
     """
-    logger.info(f"Creating digest from URL: {url}")
+    logger.info("Creating digest from URL: %s", url)
 
     # Initialize default ImageOptions if None is provided
     if options.image_options is None:
@@ -554,15 +977,15 @@ async def create_digest_from_url(
     session_data = await fetch_session_data(url)
 
     # Set up directories
-    _, session_dir, frames_dir, existing_markdown_path = _setup_output_directory(
-        options.output_dir, session_data
+    paths, existing_markdown_path = await asyncio.to_thread(
+        _setup_output_directory, options.output_dir, session_data
     )
 
     # Create title-based markdown filename
     title_for_filename = (
         session_data.title.replace(" ", "_").replace("/", "_").replace("\\", "_")
     )
-    expected_markdown_path = os.path.join(session_dir, f"{title_for_filename}.md")
+    expected_markdown_path = os.path.join(paths.session_dir, f"{title_for_filename}.md")
 
     # Check if digest already exists and skip processing if not forced
     if (
@@ -571,7 +994,7 @@ async def create_digest_from_url(
         and not options.force_regenerate
     ):
         logger.info(
-            f"Digest already exists at {existing_markdown_path}, skipping regeneration"
+            "Digest already exists at %s, skipping regeneration", existing_markdown_path
         )
 
         # Create a basic digest object with the session info and markdown path
@@ -585,24 +1008,43 @@ async def create_digest_from_url(
             source_url=url,
         )
 
-    # Download content and extract frames
-    download_paths, segments = await _download_and_extract_frames(
-        session_data, session_dir, frames_dir, options.image_options
-    )
-
-    # Generate summary and key points
-    summary, key_points = await _generate_summary_and_key_points(
-        options.ai_config,
-        download_paths,
-        segments,
-        session_data.title,
-        options.language,
+    # Download content, then start extracting frames in the background
+    download_paths, frames_exist = await _download_content(session_data, paths)
+    extraction_task = asyncio.create_task(
+        _extract_segments(download_paths, paths, frames_exist, options.image_options)
     )
 
-    # Translate content if needed
-    summary, key_points, segments = await _translate_content_if_needed(
-        options.language, options.ai_config, segments, summary, key_points
-    )
+    transcript_text = await _get_transcript_from_session(download_paths, [])
+    if transcript_text.strip():
+        # The summary only needs the transcript, so generate it while the
+        # frames are still being extracted and their captions translated
+        (summary, key_points), segments = await asyncio.gather(
+            _generate_summary_and_key_points(
+                options.ai_config,
+                transcript_text,
+                session_data.title,
+                options.language,
+            ),
+            _extract_and_translate_segments(
+                extraction_task, options.language, options.ai_config
+            ),
+        )
+        summary, key_points, _ = await _translate_content_if_needed(
+            options.language, options.ai_config, [], summary, key_points
+        )
+    else:
+        # Without transcript text the summary is built from the segment
+        # texts, so they can only be translated afterwards
+        segments = await extraction_task
+        summary, key_points = await _generate_summary_and_key_points(
+            options.ai_config,
+            "\n".join(segment.text for segment in segments),
+            session_data.title,
+            options.language,
+        )
+        summary, key_points, segments = await _translate_content_if_needed(
+            options.language, options.ai_config, segments, summary, key_points
+        )
 
     # Create the digest object
     digest = WWDCDigest(
@@ -625,27 +1067,26 @@ async def create_digest_from_url(
     return digest
 
 
-async def create_digest(
-    url: str,
-    options: DigestOptions | None = None,
-) -> WWDCDigest:
-    """Create a digest from a WWDC session URL.
+def _prepare_options(urls: list[str], options: DigestOptions | None) -> DigestOptions:
+    """Validate session URLs and resolve the AI settings of the options.
 
     Args:
-        url: URL of the WWDC session
-        options: Digest creation options including output directory, OpenAI config,
-                language, image options, and regeneration flag
+        urls: URLs of the WWDC sessions
+        options: Digest creation options (defaults are used if None)
 
     Returns:
-        A digest of the session
-    """
-    logger.info(f"Creating digest for {url}")
+        Options with the AI configuration resolved
 
+    Raises:
+        ValueError: If a URL is not a valid WWDC session URL
+    """
     # Validate URL format
-    if not url.startswith(("http://", "https://")):
-        raise ValueError(
-            "URL must start with http:// or https:// and be a valid WWDC session URL"
-        )
+    for url in urls:
+        if not _WWDC_URL_RE.match(url):
+            raise ValueError(
+                "URL must start with http:// or https:// and be a valid WWDC "
+                "session URL"
+            )
 
     # Use default options if none provided
     if options is None:
@@ -661,4 +1102,77 @@ async def create_digest(
             endpoint=options.ai_config.endpoint,
         )
 
+    return options
+
+
+async def create_digest(
+    url: str,
+    options: DigestOptions | None = None,
+) -> WWDCDigest:
+    """Create a digest from a WWDC session URL.
+
+    The pooled HTTP client is left open so that concurrent calls in the same
+    event loop keep sharing it; a later event loop gets a new client.
+
+    Args:
+        url: URL of the WWDC session
+        options: Digest creation options including output directory, OpenAI config,
+                language, image options, and regeneration flag
+
+    Returns:
+        A digest of the session
+    """
+    logger.info("Creating digest for %s", url)
+    options = _prepare_options([url], options)
     return await create_digest_from_url(url, options)
+
+
+async def create_digests(
+    urls: list[str],
+    options: DigestOptions | None = None,
+    concurrency: int = DEFAULT_DIGEST_CONCURRENCY,
+) -> list[WWDCDigest]:
+    """Create digests from several WWDC session URLs concurrently.
+
+    Sessions share the pooled HTTP client and the frame encoding process pool,
+    so downloads, API calls and frame extraction of different sessions overlap.
+
+    Args:
+        urls: URLs of the WWDC sessions
+        options: Digest creation options shared by all sessions
+        concurrency: Maximum number of sessions processed at once
+
+    Returns:
+        Digests of the sessions in the same order as the URLs
+
+    Raises:
+        ValueError: If a URL is not a valid WWDC session URL or concurrency is
+            less than 1
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    logger.info("Creating digests for %d sessions", len(urls))
+    options = _prepare_options(urls, options)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(url: str) -> WWDCDigest:
+        async with semaphore:
+            return await create_digest_from_url(url, options)
+
+    try:
+        # Let every session settle before the shared client is closed, so a
+        # failing session never tears down connections its siblings still use
+        results = await asyncio.gather(
+            *[create(url) for url in urls], return_exceptions=True
+        )
+    finally:
+        # Release pooled connections before the event loop goes away
+        await close_http_client()
+
+    digests: list[WWDCDigest] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        digests.append(result)
+    return digests
@@ -2,10 +2,11 @@
 
 import logging
 import os
-from typing import TextIO
+from collections.abc import Callable
+from pathlib import Path
 
 from .models import WWDCDigest
-from .video import parse_webvtt_time
+from .webvtt_utils import parse_webvtt_time
 
 logger = logging.getLogger("wwdcdigest")
 
@@ -13,44 +14,68 @@ logger = logging.getLogger("wwdcdigest")
 class MarkdownFormatter:
     """Implementation of DigestFormatter that creates markdown files."""
 
+    def _sorted_sample_codes(
+        self, digest: WWDCDigest
+    ) -> list[tuple[int, str | None, str]]:
+        """Collect the session's timed sample codes sorted by time.
+
+        Args:
+            digest: The WWDCDigest object
+
+        Returns:
+            (time, title, code) tuples sorted by time in seconds
+        """
+        if (
+            not hasattr(digest.session, "sample_codes")
+            or not digest.session.sample_codes
+        ):
+            return []
+
+        sample_codes: list[tuple[int, str | None, str]] = [
+            (int(sample_code.time), sample_code.title, sample_code.code)
+            for sample_code in digest.session.sample_codes
+            if sample_code.time
+        ]
+        sample_codes.sort(key=lambda sample_code: sample_code[0])
+        return sample_codes
+
     def _insert_sample_codes_for_segment(
         self,
-        f: TextIO,
-        digest: WWDCDigest,
+        append: Callable[[str], None],
+        sample_codes: list[tuple[int, str | None, str]],
+        index: int,
         start_time: int,
         end_time: int | None = None,
-    ) -> None:
+    ) -> int:
         """Insert sample codes that fall between start_time and end_time.
 
         Args:
-            f: File handle to write to
-            digest: The WWDCDigest object
+            append: Function appending a chunk of markdown to the output
+            sample_codes: (time, title, code) tuples sorted by time
+            index: Index of the first sample code not yet considered
             start_time: The start timestamp in seconds
             end_time: The end timestamp in seconds (optional)
+
+        Returns:
+            Index of the first sample code after this segment
         """
-        if (
-            not hasattr(digest.session, "sample_codes")
-            or not digest.session.sample_codes
+        # Codes before the segment start do not belong to any segment
+        while index < len(sample_codes) and sample_codes[index][0] < start_time:
+            index += 1
+
+        # If end_time is None (last segment), include all codes after start_time
+        # Otherwise, include codes that fall within the range [start_time, end_time)
+        while index < len(sample_codes) and (
+            end_time is None or sample_codes[index][0] < end_time
         ):
-            return
-
-        for sample_code in digest.session.sample_codes:
-            if not sample_code.time:
-                continue
+            _, title, code = sample_codes[index]
+            if title:
+                append(f"#### {title}\n\n")
 
-            code_time = int(sample_code.time)
+            append(f"```\n{code}\n```\n\n")
+            index += 1
 
-            # If end_time is None (last segment), include all codes after start_time
-            # Otherwise, include codes that fall within the range [start_time, end_time)
-            if (end_time is None and code_time >= start_time) or (
-                end_time is not None and start_time <= code_time < end_time
-            ):
-                if sample_code.title:
-                    f.write(f"#### {sample_code.title}\n\n")
-
-                f.write("```\n")
-                f.write(f"{sample_code.code}\n")
-                f.write("```\n\n")
+        return index
 
     def format_digest(self, digest: WWDCDigest, output_path: str) -> str:
         """Format a digest as a markdown file.
@@ -62,64 +87,77 @@ class MarkdownFormatter:
         Returns:
             Path to the created markdown file
         """
-        logger.info(f"Creating markdown file at {output_path}")
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            # Write header
-            f.write(f"# {digest.session.title}\n\n")
-
-            # Write source URL if available
-            if digest.source_url:
-                f.write(f"Source: [{digest.source_url}]({digest.source_url})\n\n")
-
-            # Write summary
-            f.write("## Summary\n\n")
-            f.write(f"{digest.summary}\n\n")
-
-            # Write key points if any
-            if digest.key_points:
-                f.write("## Key Points\n\n")
-                for point in digest.key_points:
-                    f.write(f"- {point}\n")
-                f.write("\n")
-
-            # Write transcript with images
-            f.write("## Transcript with Video Frames\n\n")
-
-            # Process segments
-            for i, segment in enumerate(digest.segments):
-                # Make image path relative to the markdown file
-                image_rel_path = os.path.relpath(
-                    segment.image_path, os.path.dirname(output_path)
+        logger.info("Creating markdown file at %s", output_path)
+
+        # Collect the markdown in memory and write the file once
+        parts: list[str] = []
+        append = parts.append
+
+        # Write header
+        append(f"# {digest.session.title}\n\n")
+
+        # Write source URL if available
+        if digest.source_url:
+            append(f"Source: [{digest.source_url}]({digest.source_url})\n\n")
+
+        # Write summary
+        append("## Summary\n\n")
+        append(f"{digest.summary}\n\n")
+
+        # Write key points if any
+        if digest.key_points:
+            append("## Key Points\n\n")
+            for point in digest.key_points:
+                append(f"- {point}\n")
+            append("\n")
+
+        # Write transcript with images
+        append("## Transcript with Video Frames\n\n")
+
+        # Parse each timestamp once; a segment ends where the next one starts
+        timestamps = [
+            int(parse_webvtt_time(segment.timestamp)) for segment in digest.segments
+        ]
+        output_dir = os.path.dirname(output_path)
+        source_url = digest.source_url
+
+        # Sort sample codes by time once so segments can consume them in order
+        sample_codes = self._sorted_sample_codes(digest)
+        code_index = 0
+
+        # Process segments
+        for i, segment in enumerate(digest.segments):
+            # Make image path relative to the markdown file
+            image_rel_path = os.path.relpath(segment.image_path, output_dir)
+
+            # Calculate timestamp in seconds
+            timestamp_seconds = timestamps[i]
+
+            # Calculate end time if this isn't the last segment
+            end_time = timestamps[i + 1] if i + 1 < len(timestamps) else None
+
+            # Write timestamp as heading with link to the specific time in the video
+            if source_url:
+                heading = (
+                    f"[{segment.timestamp}]({source_url}?time={timestamp_seconds})"
                 )
+            else:
+                heading = segment.timestamp
 
-                # Calculate timestamp in seconds
-                timestamp_seconds = int(parse_webvtt_time(segment.timestamp))
-
-                # Calculate end time if this isn't the last segment
-                end_time = None
-                if i < len(digest.segments) - 1:
-                    end_time = int(parse_webvtt_time(digest.segments[i + 1].timestamp))
-
-                # Write timestamp as heading with link to the specific time in the video
-                if digest.source_url:
-                    timestamp_url = f"{digest.source_url}?time={timestamp_seconds}"
-                    f.write(f"### [{segment.timestamp}]({timestamp_url})\n\n")
-                else:
-                    f.write(f"### {segment.timestamp}\n\n")
+            # Write heading, text and image as one chunk
+            append(
+                f"### {heading}\n\n"
+                f"{segment.text}\n\n"
+                f"![Frame at {segment.timestamp}]({image_rel_path})\n\n"
+            )
 
-                # Write text
-                f.write(f"{segment.text}\n\n")
-
-                # Write image
-                f.write(f"![Frame at {segment.timestamp}]({image_rel_path})\n\n")
-
-                # Insert sample codes for this segment
-                self._insert_sample_codes_for_segment(
-                    f, digest, timestamp_seconds, end_time
-                )
+            # Insert sample codes for this segment
+            code_index = self._insert_sample_codes_for_segment(
+                append, sample_codes, code_index, timestamp_seconds, end_time
+            )
 
-                # Add separator
-                f.write("---\n\n")
+            # Add separator
+            append("---\n\n")
 
+        Path(output_path).write_text("".join(parts), encoding="utf-8")
         return output_path
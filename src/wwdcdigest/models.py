@@ -9,7 +9,7 @@ from wwdctools.models import WWDCSession
 class ImageOptions(BaseModel):
     """Model representing image extraction options."""
 
-    format: Literal["jpg", "png", "avif", "webp"] = "jpg"
+    format: Literal["jpg", "png", "avif", "webp"] = "avif"
     width: int | None = None
 
 
@@ -1,15 +1,23 @@
 """Functions for interacting with OpenAI's API."""
 
+import asyncio
+import json
 import logging
 import re
 from collections.abc import Callable
 
 from openai import APIError, AsyncOpenAI, RateLimitError
 
+from ._http import get_http_client
+from ._translate_cache import get_translation_cache
 from .models import OpenAIConfig, OpenAIResponse
 
 logger = logging.getLogger("wwdcdigest")
 
+# Model used for translation requests (part of the translation cache key,
+# together with the API endpoint)
+TRANSLATION_MODEL = "gpt-4.1"
+
 
 class OpenAIError(Exception):
     """Base class for OpenAI-related errors."""
@@ -17,6 +25,12 @@ class OpenAIError(Exception):
     pass
 
 
+class OpenAIResponseError(OpenAIError):
+    """Raised when a response cannot be mapped back onto its request."""
+
+    pass
+
+
 def is_likely_in_language(text: str, target_language: str) -> bool:
     """Check if text is likely already in the target language.
 
@@ -104,16 +118,26 @@ async def translate_text(
     # Skip translation if text is already in the target language
     if is_likely_in_language(text, target_language):
         logger.info(
-            f"Text appears to already be in {target_language}, skipping translation"
+            "Text appears to already be in %s, skipping translation", target_language
         )
         return text
 
-    logger.info(f"Translating text to {target_language}")
+    cache = get_translation_cache()
+    if cache and (
+        cached := await asyncio.to_thread(
+            cache.get, text, target_language, TRANSLATION_MODEL, config.endpoint
+        )
+    ):
+        logger.debug("Using cached translation")
+        return cached
+
+    logger.info("Translating text to %s", target_language)
 
     try:
         client = AsyncOpenAI(
             api_key=config.api_key,
             base_url=config.endpoint,
+            http_client=get_http_client(),
         )
 
         # Create a prompt for translation
@@ -123,7 +147,7 @@ async def translate_text(
         )
 
         completion = await client.chat.completions.create(
-            model="gpt-4.1",
+            model=TRANSLATION_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -141,6 +165,15 @@ async def translate_text(
         # Extract translated text
         if translation := completion.choices[0].message.content:
             logger.debug("Successfully translated text")
+            if cache:
+                await asyncio.to_thread(
+                    cache.set,
+                    text,
+                    target_language,
+                    TRANSLATION_MODEL,
+                    translation,
+                    config.endpoint,
+                )
             return translation
 
         logger.error("No translation found in OpenAI completion")
@@ -151,14 +184,159 @@ async def translate_text(
         raise OpenAIError("OpenAI API rate limit exceeded") from e
 
     except APIError as e:
-        logger.error(f"OpenAI API error: {e}")
+        logger.error("OpenAI API error: %s", e)
         raise OpenAIError(f"OpenAI API error: {e}") from e
 
     except Exception as e:
-        logger.error(f"Error translating text: {e}")
+        logger.error("Error translating text: %s", e)
         raise OpenAIError("An unexpected error occurred while translating") from e
 
 
+def _parse_translations(content: str | None, expected_count: int) -> list[str]:
+    """Parse a batch translation response.
+
+    Args:
+        content: The raw JSON content returned by the API
+        expected_count: The number of translations expected
+
+    Returns:
+        List of translated texts
+
+    Raises:
+        OpenAIResponseError: If the response is not a list of the expected length
+    """
+    if not content:
+        raise OpenAIResponseError("No translation found in OpenAI completion")
+
+    try:
+        translations = json.loads(content).get("translations")
+    except (json.JSONDecodeError, AttributeError) as e:
+        raise OpenAIResponseError("OpenAI returned malformed translation JSON") from e
+
+    if not isinstance(translations, list) or len(translations) != expected_count:
+        raise OpenAIResponseError(
+            "OpenAI returned an unexpected number of translations"
+        )
+
+    return [str(translation) for translation in translations]
+
+
+async def translate_texts(
+    texts: list[str],
+    target_language: str,
+    config: OpenAIConfig,
+) -> list[str]:
+    """Translate multiple texts to the target language in a single request.
+
+    Texts that already appear to be in the target language are returned as is
+    and are not sent to the API.
+
+    Args:
+        texts: The texts to translate
+        target_language: The target language code (e.g., "ja", "fr", "es")
+        config: OpenAI API configuration
+
+    Returns:
+        Translated texts in the same order as the input
+
+    Raises:
+        OpenAIResponseError: If the response does not contain one translation
+            per text
+        OpenAIError: If there's an error calling the OpenAI API
+    """
+    results = list(texts)
+    candidates = [
+        i
+        for i, text in enumerate(texts)
+        if not is_likely_in_language(text, target_language)
+    ]
+    cache = get_translation_cache()
+    if cache and candidates:
+        cached = await asyncio.to_thread(
+            cache.get_many,
+            [texts[i] for i in candidates],
+            target_language,
+            TRANSLATION_MODEL,
+            config.endpoint,
+        )
+    else:
+        cached = [None] * len(candidates)
+
+    pending: list[int] = []
+    for i, translation in zip(candidates, cached, strict=True):
+        if translation:
+            results[i] = translation
+        else:
+            pending.append(i)
+
+    if not pending:
+        return results
+
+    logger.info("Translating %s texts to %s", len(pending), target_language)
+
+    try:
+        client = AsyncOpenAI(
+            api_key=config.api_key,
+            base_url=config.endpoint,
+            http_client=get_http_client(),
+        )
+
+        # Send all texts as one JSON array to amortize the request overhead
+        prompt = (
+            f"Translate each element of the following JSON array into "
+            f"{target_language}. Maintain the technical accuracy and terminology. "
+            'Respond with a JSON object of the form {"translations": [...]} '
+            "containing the translated strings in the same order:\n\n"
+            f"{json.dumps([texts[i] for i in pending], ensure_ascii=False)}"
+        )
+
+        completion = await client.chat.completions.create(
+            model=TRANSLATION_MODEL,
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You are an expert translator specializing in technical "
+                        "content. Translate the text accurately while preserving "
+                        "technical terms and maintaining the original meaning."
+                    ),
+                },
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+
+    except RateLimitError as e:
+        logger.error("Rate limit exceeded when calling OpenAI API")
+        raise OpenAIError("OpenAI API rate limit exceeded") from e
+
+    except APIError as e:
+        logger.error("OpenAI API error: %s", e)
+        raise OpenAIError(f"OpenAI API error: {e}") from e
+
+    except Exception as e:
+        logger.error("Error translating texts: %s", e)
+        raise OpenAIError("An unexpected error occurred while translating") from e
+
+    translations = _parse_translations(
+        completion.choices[0].message.content, len(pending)
+    )
+    for i, translation in zip(pending, translations, strict=True):
+        results[i] = translation
+    if cache:
+        await asyncio.to_thread(
+            cache.set_many,
+            {texts[i]: results[i] for i in pending},
+            target_language,
+            TRANSLATION_MODEL,
+            config.endpoint,
+        )
+
+    logger.debug("Successfully translated texts")
+    return results
+
+
 async def generate_summary_and_key_points(
     transcript: str,
     session_title: str,
@@ -180,13 +358,14 @@ async def generate_summary_and_key_points(
         OpenAIError: If there's an error calling the OpenAI API
     """
     logger.info(
-        f"Generating summary and key points for '{session_title}' in {language}"
+        "Generating summary and key points for '%s' in %s", session_title, language
     )
 
     try:
         client = AsyncOpenAI(
             api_key=config.api_key,
             base_url=config.endpoint,
+            http_client=get_http_client(),
         )
 
         # Determine language for output
@@ -243,11 +422,11 @@ async def generate_summary_and_key_points(
         raise OpenAIError("OpenAI API rate limit exceeded") from e
 
     except APIError as e:
-        logger.error(f"OpenAI API error: {e}")
+        logger.error("OpenAI API error: %s", e)
         raise OpenAIError(f"OpenAI API error: {e}") from e
 
     except Exception as e:
-        logger.error(f"Error generating summary and key points: {e}")
+        logger.error("Error generating summary and key points: %s", e)
         raise OpenAIError(
             "An unexpected error occurred while generating content"
         ) from e
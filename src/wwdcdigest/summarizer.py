@@ -29,7 +29,7 @@ class DefaultSummarizer:
         Returns:
             Tuple of (summary, key_points)
         """
-        logger.info(f"Using default summarizer for {session_title}")
+        logger.info("Using default summarizer for %s", session_title)
         summary = f"Summary of {session_title}"
         key_points = []
         return summary, key_points
@@ -54,7 +54,7 @@ class OpenAIContentSummarizer(OpenAISummarizer):
         Returns:
             Tuple of (summary, key_points)
         """
-        logger.info(f"Generating summary for {session_title} using OpenAI")
+        logger.info("Generating summary for %s using OpenAI", session_title)
         return await generate_summary_and_key_points(
             transcript, session_title, self.config, language
         )
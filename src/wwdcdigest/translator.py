@@ -2,10 +2,10 @@
 
 import logging
 
+from ._translate import translate_digest_content
 from .cli_ai import complete_text_with_cli
 from .interfaces import ExternalAITranslator, OpenAITranslator
 from .models import WWDCFrameSegment
-from .openai_utils import translate_text
 
 logger = logging.getLogger("wwdcdigest")
 
@@ -31,30 +31,20 @@ class OpenAIContentTranslator(OpenAITranslator):
         Returns:
             Tuple of (translated_summary, translated_key_points, translated_segments)
         """
-        logger.info(f"Translating content to {target_language} using OpenAI")
+        logger.info("Translating content to %s using OpenAI", target_language)
 
-        # Translate summary
-        translated_summary = await translate_text(summary, target_language, self.config)
-
-        # Translate key points
-        translated_key_points = []
-        for point in key_points:
-            translated_point = await translate_text(point, target_language, self.config)
-            translated_key_points.append(translated_point)
-
-        # Translate segment text
-        for segment in segments:
-            segment.text = await translate_text(
-                segment.text, target_language, self.config
-            )
-
-        return translated_summary, translated_key_points, segments
+        # Translate everything in batch requests rather than one call per text
+        return await translate_digest_content(
+            summary, key_points, segments, target_language, self.config
+        )
 
 
 class ExternalAIContentTranslator(ExternalAITranslator):
     """Implementation of ContentTranslator using an external AI CLI."""
 
     async def _translate_text(self, text: str, target_language: str) -> str:
+        if not text.strip():
+            return text
         prompt = (
             f"Translate the following text into {target_language}. "
             "Preserve technical accuracy and terminology. "
@@ -77,12 +67,16 @@ class ExternalAIContentTranslator(ExternalAITranslator):
             self.config.provider,
         )
 
-        translated_summary = await self._translate_text(summary, target_language)
-        translated_key_points = [
-            await self._translate_text(point, target_language) for point in key_points
-        ]
+        # Repeated texts (such as recurring captions) are translated once
+        texts = [summary, *key_points, *(segment.text for segment in segments)]
+        translations: dict[str, str] = {}
+        for text in dict.fromkeys(texts):
+            translations[text] = await self._translate_text(text, target_language)
+
+        translated_summary = translations[summary]
+        translated_key_points = [translations[point] for point in key_points]
 
         for segment in segments:
-            segment.text = await self._translate_text(segment.text, target_language)
+            segment.text = translations[segment.text]
 
         return translated_summary, translated_key_points, segments
@@ -1,7 +1,17 @@
 """Video processing utilities for WWDC digests."""
 
 import logging
+import multiprocessing
 import os
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 
 import cv2
 import numpy as np
@@ -19,15 +29,107 @@ from .webvtt_utils import (
 logger = logging.getLogger("wwdcdigest")
 
 # Constants for image comparison
-# Higher value means images need to be more similar to be merged
+# Higher value means images need to be more similar to be merged; 0.95 lets
+# at most 3 of the 64 hash bits differ
 SIMILARITY_THRESHOLD = 0.95
 
+# Width of the grayscale thumbnails frames are downscaled to for comparison
+COMPARE_WIDTH = 320
+
+# Frames are compared by a difference hash of HASH_SIZE x HASH_SIZE bits
+HASH_SIZE = 8
+HASH_BITS = HASH_SIZE * HASH_SIZE
+
+# Difference hash and mean brightness of a frame
+type FrameSignature = tuple[int, float]
+
+# Frame images written by extract_frames_from_video (frame_XXXX.ext)
+_FRAME_FILENAME_RE = re.compile(r"frame_(\d+)\.(?:jpe?g|png|avif|webp)", re.IGNORECASE)
+
+# Start of each frame's entry in a frames directory's metadata.txt
+_METADATA_FRAME_RE = re.compile(r"^[ \t]*Frame:", re.MULTILINE)
+
+# Encoder settings. AVIF keeps slide text legible at a much lower quality
+# setting than WebP needs.
+AVIF_SAVE_OPTIONS = {"quality": 50, "speed": 6}
+WEBP_QUALITY = 90
+
+
+def _cv2_avif_params() -> list[int] | None:
+    """Build the OpenCV encoder parameters for AVIF frames.
+
+    Returns:
+        imwrite parameters if this OpenCV build can encode AVIF, otherwise None.
+        Builds without libavif (such as the PyPI wheels) and releases before
+        4.11, which lack the AVIF flags, fall back to PIL.
+    """
+    quality_flag = getattr(cv2, "IMWRITE_AVIF_QUALITY", None)
+    speed_flag = getattr(cv2, "IMWRITE_AVIF_SPEED", None)
+    if quality_flag is None or speed_flag is None:
+        return None
+    if not cv2.haveImageWriter(".avif"):
+        return None
+    return [
+        quality_flag,
+        AVIF_SAVE_OPTIONS["quality"],
+        speed_flag,
+        AVIF_SAVE_OPTIONS["speed"],
+    ]
+
+
+# OpenCV encodes AVIF straight from BGR frames when it supports it
+CV2_AVIF_PARAMS = _cv2_avif_params()
+
+# Frame encoding runs in worker processes; bound the number of frames waiting
+# to be encoded so decoded frames do not pile up in memory
+ENCODE_WORKERS = os.cpu_count() or 1
+MAX_PENDING_ENCODES = 2 * ENCODE_WORKERS
+
+# Gaps between caption frames longer than this are skipped with a seek, which
+# decodes from the nearest keyframe, instead of grabbing every frame in between
+SEEK_GAP_FRAMES = 250
+
+_encode_executor: Executor | None = None
+
+
+def get_encode_executor() -> Executor:
+    """Return the shared executor for frame encoding, creating it on first use.
+
+    The workers are started with forkserver (or spawn where forkserver is not
+    available) rather than fork, because the pool is created from a worker
+    thread of a multi-threaded process, and forking that can deadlock the
+    child, for example on a lock held by OpenCV's thread pool.
+
+    Returns:
+        The shared ProcessPoolExecutor, or a ThreadPoolExecutor if worker
+        processes are not available on this platform (the image encoders
+        release the GIL, so threads still encode in parallel)
+    """
+    global _encode_executor  # noqa: PLW0603
+
+    if _encode_executor is None:
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        try:
+            _encode_executor = ProcessPoolExecutor(
+                max_workers=ENCODE_WORKERS,
+                mp_context=multiprocessing.get_context(start_method),
+            )
+        except (OSError, NotImplementedError) as e:
+            logger.warning("Encoding frames in threads: %s", e)
+            _encode_executor = ThreadPoolExecutor(max_workers=ENCODE_WORKERS)
+    return _encode_executor
+
 
 def extract_frames_from_video(
     video_path: str,
     subtitle_path: str,
     output_dir: str,
     image_options: ImageOptions,
+    encode_executor: Executor | None = None,
 ) -> list[WWDCFrameSegment]:
     """Extract frames from video at subtitle timestamps.
 
@@ -36,25 +138,32 @@ def extract_frames_from_video(
         subtitle_path: Path to the WebVTT subtitle file
         output_dir: Directory to save extracted frames
         image_options: Options for image extraction and formatting
+        encode_executor: Executor to encode frames in parallel, or None to
+            encode them in the calling thread
 
     Returns:
         List of WWDCFrameSegment objects with timestamp, text and image path
     """
-    logger.info(f"Extracting frames from {video_path} using {subtitle_path}")
+    logger.info("Extracting frames from %s using %s", video_path, subtitle_path)
 
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    # Open video file
-    video = cv2.VideoCapture(video_path)
+    # Open video file, decoding on the GPU/media engine where the backend
+    # supports it (OpenCV falls back to software decoding otherwise)
+    video = cv2.VideoCapture(
+        video_path,
+        cv2.CAP_ANY,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
     if not video.isOpened():
-        logger.error(f"Could not open video: {video_path}")
+        logger.error("Could not open video: %s", video_path)
         return []
 
     # Get video properties
     fps = video.get(cv2.CAP_PROP_FPS)
     duration = video.get(cv2.CAP_PROP_FRAME_COUNT) / fps
-    logger.debug(f"Video: {fps} fps, {duration:.2f} seconds")
+    logger.debug("Video: %s fps, %.2f seconds", fps, duration)
 
     # Parse WebVTT
     segments = []
@@ -67,64 +176,20 @@ def extract_frames_from_video(
     try:
         # Parse WebVTT
         vtt = webvtt.read(combined_subtitle_path)
-        raw_segments = []
-
-        # Track unique captions to deduplicate identical entries
-        unique_captions = {}
-
-        # First pass: extract all frames without merging
-        for i, caption in enumerate(vtt.captions):
-            start_time = parse_webvtt_time(caption.start)
-
-            # Create clean text from caption
-            text = caption.text.strip()
-
-            # Skip if this is a duplicate caption with the same timestamp and text
-            caption_key = f"{caption.start}_{text}"
-            if caption_key in unique_captions:
-                logger.debug(
-                    f"Skipping duplicate caption at {caption.start}: {text[:30]}..."
-                )
-                continue
+        targets = _collect_caption_targets(vtt.captions, fps)
 
-            unique_captions[caption_key] = i
-
-            # Seek to timestamp position
-            video.set(cv2.CAP_PROP_POS_MSEC, start_time * 1000)
-
-            # Read frame
-            success, frame = video.read()
-            if success:
-                # Save frame as image with the specified format
-                image_filename = f"frame_{i:04d}.{image_options.format}"
-                image_path = os.path.join(output_dir, image_filename)
-                _save_frame_image(frame, image_path, image_options)
-
-                # Create segment
-                segment = WWDCFrameSegment(
-                    timestamp=caption.start, text=text, image_path=image_path
-                )
-                raw_segments.append(segment)
-                logger.debug(f"Extracted frame at {caption.start}: {text[:30]}...")
-            else:
-                logger.warning(f"Failed to extract frame at {caption.start}")
-
-        # Second pass: merge similar consecutive frames
-        merged_segments, unused_image_files = _process_raw_segments(raw_segments)
-
-        # Delete unused image files
-        if unused_image_files:
-            delete_unused_image_files(unused_image_files)
-            logger.info(f"Deleted {len(unused_image_files)} unused image files")
-
-        segments = merged_segments
+        # Extract frames, merging similar consecutive frames before encoding
+        segments, frame_count = _grab_target_frames(
+            video, targets, output_dir, image_options, encode_executor
+        )
         logger.info(
-            f"Extracted {len(raw_segments)} frames, "
-            f"merged to {len(segments)} unique segments"
+            "Extracted %s frames, merged to %s unique segments",
+            frame_count,
+            len(segments),
         )
 
     except Exception as e:
-        logger.error(f"Error parsing WebVTT file: {e}")
+        logger.error("Error parsing WebVTT file: %s", e)
 
     # Release video
     video.release()
@@ -132,111 +197,320 @@ def extract_frames_from_video(
     return segments
 
 
-def _process_raw_segments(
-    raw_segments: list[WWDCFrameSegment],
-) -> tuple[list[WWDCFrameSegment], list[str]]:
-    """Process raw segments by merging similar consecutive frames.
+def _collect_caption_targets(
+    captions: list[webvtt.Caption],
+    fps: float,
+) -> list[tuple[int, int, str, str]]:
+    """Map each unique caption to the video frame to capture for it.
 
     Args:
-        raw_segments: Raw frame segments extracted from video
+        captions: Captions parsed from the WebVTT file
+        fps: Frame rate of the video
 
     Returns:
-        Tuple of (merged segments, unused image files)
+        List of (frame index, caption index, timestamp, text) sorted by frame
     """
-    if not raw_segments:
-        return [], []
+    # Track unique captions to deduplicate identical entries
+    unique_captions: set[tuple[str, str]] = set()
+    targets: list[tuple[int, int, str, str]] = []
 
-    merged_segments = [raw_segments[0]]
-    unused_image_files = []  # Track image files that will no longer be used
+    for i, caption in enumerate(captions):
+        start_time = parse_webvtt_time(caption.start)
 
-    for i in range(1, len(raw_segments)):
-        current_segment = raw_segments[i]
-        prev_segment = merged_segments[-1]
+        # Create clean text from caption
+        text = caption.text.strip()
 
-        # Compare current frame with the last merged frame
-        similarity = compare_images(prev_segment.image_path, current_segment.image_path)
+        # Skip if this is a duplicate caption with the same timestamp and text
+        caption_key = (caption.start, text)
+        if caption_key in unique_captions:
+            logger.debug(
+                "Skipping duplicate caption at %s: %s...", caption.start, text[:30]
+            )
+            continue
 
-        if similarity >= SIMILARITY_THRESHOLD:
-            # Frames are similar, merge by keeping the last one and appending text
-            if prev_segment.text != current_segment.text:
-                merged_segments[
-                    -1
-                ].text = f"{prev_segment.text}\n{current_segment.text}"
+        unique_captions.add(caption_key)
+        targets.append((round(start_time * fps), i, caption.start, text))
 
-            # Keep the last image and mark the previous one as unused
-            unused_image_files.append(prev_segment.image_path)
-            merged_segments[-1].image_path = current_segment.image_path
+    targets.sort()
+    return targets
 
+
+def _iter_target_frames(
+    video: cv2.VideoCapture,
+    targets: list[tuple[int, int, str, str]],
+) -> Iterator[tuple[int, str, str, np.ndarray, FrameSignature | None]]:
+    """Decode the frames at the target indices in a single forward pass.
+
+    Frames up to each target are only grabbed, and pixels are retrieved for the
+    targets themselves. This avoids a keyframe seek and re-decode per caption;
+    only gaps longer than SEEK_GAP_FRAMES are skipped with a seek.
+
+    Args:
+        video: Opened video capture positioned at the start
+        targets: Targets sorted by frame index, from _collect_caption_targets
+
+    Yields:
+        Tuples of (caption index, timestamp, text, frame, frame signature) for
+        every target whose frame could be decoded
+    """
+    position = -1
+    # Pixels and comparison signature of the frame at the current position
+    retrieved: tuple[np.ndarray, FrameSignature | None] | None = None
+
+    for frame_index, i, timestamp, text in targets:
+        if frame_index - position > SEEK_GAP_FRAMES and video.set(
+            cv2.CAP_PROP_POS_FRAMES, frame_index
+        ):
+            position = frame_index - 1
+            retrieved = None
+
+        while position < frame_index:
+            if not video.grab():
+                break
+            position += 1
+            retrieved = None
+
+        if position < frame_index:
+            logger.warning("Failed to extract frame at %s", timestamp)
+            continue
+
+        # Captions starting on the same frame share the retrieved pixels
+        if retrieved is None:
+            success, frame = video.retrieve()
+            if not success:
+                logger.warning("Failed to extract frame at %s", timestamp)
+                continue
+            retrieved = (frame, _frame_signature(_comparison_thumbnail(frame)))
+
+        yield i, timestamp, text, *retrieved
+
+
+def _grab_target_frames(
+    video: cv2.VideoCapture,
+    targets: list[tuple[int, int, str, str]],
+    output_dir: str,
+    image_options: ImageOptions,
+    encode_executor: Executor | None = None,
+) -> tuple[list[WWDCFrameSegment], int]:
+    """Save the frames at the target indices, merging similar consecutive ones.
+
+    A merged segment keeps the text of every caption and the image of its last
+    frame. A segment's frame is only encoded once the next, different frame
+    shows that it is final, so frames that are merged away are never written.
+
+    Args:
+        video: Opened video capture positioned at the start
+        targets: Targets sorted by frame index, from _collect_caption_targets
+        output_dir: Directory to save extracted frames
+        image_options: Options for image extraction and formatting
+        encode_executor: Executor to encode frames in parallel, or None to
+            encode them in the calling thread
+
+    Returns:
+        Tuple of (merged WWDCFrameSegment objects, number of extracted frames)
+    """
+    segments: list[WWDCFrameSegment] = []
+    pending_encodes: deque[Future[None]] = deque()
+    frame_count = 0
+    # Frame of the last segment, encoded once no later frame replaces it
+    unsaved: tuple[np.ndarray, str] | None = None
+    last_signature: FrameSignature | None = None
+
+    def save(frame: np.ndarray, image_path: str) -> None:
+        if encode_executor is None:
+            _save_frame_image(frame, image_path, image_options)
+            return
+        # Resize before handing the frame to a worker so only the smaller
+        # frame is copied to it
+        frame = _resize_frame(frame, image_options.width)
+        if len(pending_encodes) >= MAX_PENDING_ENCODES:
+            pending_encodes.popleft().result()
+        pending_encodes.append(
+            encode_executor.submit(_save_frame_image, frame, image_path, image_options)
+        )
+
+    for i, timestamp, text, frame, signature in _iter_target_frames(video, targets):
+        frame_count += 1
+        image_filename = f"frame_{i:04d}.{image_options.format}"
+        image_path = os.path.join(output_dir, image_filename)
+
+        similarity = (
+            _signature_similarity(last_signature, signature) if segments else 0.0
+        )
+        if similarity >= SIMILARITY_THRESHOLD:
+            # Frames are similar, merge by keeping the last one and appending text
+            prev_segment = segments[-1]
+            if prev_segment.text != text:
+                prev_segment.text = f"{prev_segment.text}\n{text}"
+            prev_segment.image_path = image_path
             logger.debug(
-                f"Merged frame {current_segment.timestamp} "
-                f"with {prev_segment.timestamp} (similarity: {similarity:.2f})"
+                "Merged frame %s with %s (similarity: %.2f)",
+                timestamp,
+                prev_segment.timestamp,
+                similarity,
             )
         else:
-            # Frames are different, add as a new segment
-            merged_segments.append(current_segment)
+            # Frames are different, so the previous segment's frame is final
+            if unsaved is not None:
+                save(*unsaved)
+            segments.append(
+                WWDCFrameSegment(timestamp=timestamp, text=text, image_path=image_path)
+            )
+            logger.debug("Extracted frame at %s: %s...", timestamp, text[:30])
+
+        unsaved = (frame, image_path)
+        last_signature = signature
 
-    return merged_segments, unused_image_files
+    if unsaved is not None:
+        save(*unsaved)
 
+    # Wait for every image to be written before the segments are returned
+    for encode in pending_encodes:
+        encode.result()
 
-def delete_unused_image_files(file_paths: list[str]) -> None:
-    """Delete unused image files after merging similar frames.
+    return segments, frame_count
+
+
+def _comparison_thumbnail(frame: np.ndarray) -> np.ndarray:
+    """Downscale a video frame to a grayscale thumbnail for comparison.
 
     Args:
-        file_paths: List of file paths to delete
+        frame: The video frame as a numpy array (OpenCV format)
+
+    Returns:
+        Grayscale thumbnail COMPARE_WIDTH pixels wide
     """
-    for file_path in file_paths:
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.debug(f"Deleted unused image file: {file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to delete file {file_path}: {e}")
+    h, w = frame.shape[:2]
+    if w > COMPARE_WIDTH:
+        frame = cv2.resize(
+            frame,
+            (COMPARE_WIDTH, max(1, round(h * COMPARE_WIDTH / w))),
+            interpolation=cv2.INTER_AREA,
+        )
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
 
-def compare_images(img1_path: str, img2_path: str) -> float:
-    """Compare two images and return a similarity score.
+def _load_grayscale(image: str | np.ndarray) -> np.ndarray:
+    """Load an image as a grayscale array.
 
     Args:
-        img1_path: Path to the first image
-        img2_path: Path to the second image
+        image: Path to an image file, or an image array (grayscale or BGR)
 
     Returns:
-        Similarity score between 0.0 and 1.0 (higher means more similar)
+        Grayscale image array
     """
-    try:
+    if isinstance(image, str):
         # Use PIL to read images to support all formats (jpg, png, avif, webp)
-        pil_img1 = Image.open(img1_path)
-        pil_img2 = Image.open(img2_path)
+        with Image.open(image) as pil_image:
+            # Let JPEG decode straight to reduced-size grayscale (a no-op for
+            # other formats), keeping at least the comparison thumbnail width
+            pil_image.draft("L", (COMPARE_WIDTH, 1))
+            return np.asarray(pil_image.convert("L"))
+    if image.ndim == 3:  # noqa: PLR2004
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return image
+
+
+def _dhash(gray: np.ndarray) -> int:
+    """Compute the difference hash of a grayscale image.
 
-        # Convert PIL images to numpy arrays for OpenCV processing
-        img1 = cv2.cvtColor(np.array(pil_img1), cv2.COLOR_RGB2BGR)
-        img2 = cv2.cvtColor(np.array(pil_img2), cv2.COLOR_RGB2BGR)
+    The image is downsampled to (HASH_SIZE + 1) x HASH_SIZE, and each bit
+    records whether a pixel is brighter than its left neighbour.
 
-        # Resize to the same dimensions if they differ
-        if img1.shape != img2.shape:
-            img2 = cv2.resize(img2, (img1.shape[1], img1.shape[0]))
+    Args:
+        gray: Grayscale image array
 
-        # Convert to grayscale for better comparison
-        gray1 = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
-        gray2 = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
+    Returns:
+        HASH_BITS-bit hash as an integer
+    """
+    small = cv2.resize(
+        gray, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA
+    ).astype(np.int16)
+    bits = np.packbits(small[:, 1:] > small[:, :-1])
+    return int.from_bytes(bits.tobytes(), "big")
 
-        # Calculate histogram-based comparison score
-        hist1 = cv2.calcHist([gray1], [0], None, [256], [0, 256])
-        hist2 = cv2.calcHist([gray2], [0], None, [256], [0, 256])
 
-        # Normalize histograms
-        cv2.normalize(hist1, hist1, 0, 1, cv2.NORM_MINMAX)
-        cv2.normalize(hist2, hist2, 0, 1, cv2.NORM_MINMAX)
+def _frame_signature(image: str | np.ndarray) -> FrameSignature | None:
+    """Compute the comparison signature of an image.
 
-        # Compare histograms using correlation method
-        # Returns a value between 0 and 1 (1 means identical)
-        return cv2.compareHist(hist1, hist2, cv2.HISTCMP_CORREL)
+    Args:
+        image: Path to an image file, or an image array
+
+    Returns:
+        Tuple of (difference hash, mean brightness), or None if the image
+        cannot be read
+    """
+    try:
+        gray = _load_grayscale(image)
     except Exception as e:
         logger.warning(
-            f"Failed to read images for comparison: {img1_path}, "
-            f"{img2_path}. Error: {e}"
+            "Failed to read image for comparison: %s. Error: %s",
+            image if isinstance(image, str) else "<array>",
+            e,
         )
+        return None
+    return _dhash(gray), float(gray.mean())
+
+
+def _signature_similarity(
+    signature1: FrameSignature | None, signature2: FrameSignature | None
+) -> float:
+    """Compute the similarity of two image signatures.
+
+    The score is the fraction of matching difference-hash bits, which captures
+    the layout of the image, capped by the similarity of the mean brightness,
+    which the hash alone ignores (a black and a white frame hash the same).
+
+    Args:
+        signature1: Signature of the first image, or None if unreadable
+        signature2: Signature of the second image, or None if unreadable
+
+    Returns:
+        Similarity score between 0.0 and 1.0 (higher means more similar)
+    """
+    if signature1 is None or signature2 is None:
         return 0.0
+    hash1, brightness1 = signature1
+    hash2, brightness2 = signature2
+    hash_similarity = 1.0 - (hash1 ^ hash2).bit_count() / HASH_BITS
+    brightness_similarity = 1.0 - abs(brightness1 - brightness2) / 255.0
+    return min(hash_similarity, brightness_similarity)
+
+
+def compare_images(img1: str | np.ndarray, img2: str | np.ndarray) -> float:
+    """Compare two images and return a similarity score.
+
+    This is public API for comparing saved or in-memory images with the same
+    measure that frame extraction uses to merge similar frames; extraction
+    itself compares precomputed signatures instead of calling it.
+
+    Args:
+        img1: Path to the first image, or the image as an array
+        img2: Path to the second image, or the image as an array
+
+    Returns:
+        Similarity score between 0.0 and 1.0 (higher means more similar)
+    """
+    return _signature_similarity(_frame_signature(img1), _frame_signature(img2))
+
+
+def _resize_frame(frame: np.ndarray, width: int | None) -> np.ndarray:
+    """Resize a frame to the given width, keeping its aspect ratio.
+
+    Args:
+        frame: The video frame as a numpy array (OpenCV format)
+        width: Target width in pixels, or None to keep the original size
+
+    Returns:
+        The resized frame, or the frame itself if it already has the width
+    """
+    h, w = frame.shape[:2]
+    if width is None or w == width:
+        return frame
+
+    new_height = int(width / (w / h))
+    logger.debug("Resized frame to %sx%s", width, new_height)
+    return cv2.resize(frame, (width, new_height), interpolation=cv2.INTER_AREA)
 
 
 def _save_frame_image(
@@ -252,23 +526,44 @@ def _save_frame_image(
         image_options: Options for image extraction and formatting
     """
     # Resize if image_width is specified
-    if image_options.width is not None:
-        h, w = frame.shape[:2]
-        aspect_ratio = w / h
-        new_height = int(image_options.width / aspect_ratio)
-        frame = cv2.resize(frame, (image_options.width, new_height))
-        logger.debug(f"Resized frame to {image_options.width}x{new_height}")
-
-    if image_options.format in ("avif", "webp"):
-        # Convert OpenCV BGR to RGB for PIL
+    frame = _resize_frame(frame, image_options.width)
+
+    if image_options.format == "avif" and CV2_AVIF_PARAMS is not None:
+        cv2.imwrite(image_path, frame, CV2_AVIF_PARAMS)
+    elif image_options.format == "avif":
+        # This OpenCV build has no AVIF encoder, so convert BGR to RGB for PIL
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         pil_image = Image.fromarray(rgb_frame)
-        pil_image.save(image_path, format=image_options.format.upper(), quality=90)
-        logger.debug(f"Saved frame as {image_options.format.upper()}: {image_path}")
+        pil_image.save(image_path, format="AVIF", **AVIF_SAVE_OPTIONS)
+    elif image_options.format == "webp":
+        # Encode straight from the BGR array without a PIL round trip
+        cv2.imwrite(image_path, frame, [cv2.IMWRITE_WEBP_QUALITY, WEBP_QUALITY])
     else:
         # Use OpenCV for jpg and png
         cv2.imwrite(image_path, frame)
-        logger.debug(f"Saved frame as {image_options.format.upper()}: {image_path}")
+    logger.debug("Saved frame as %s: %s", image_options.format.upper(), image_path)
+
+
+def _parse_frame_metadata(content: str) -> dict[str, str]:
+    """Parse the captions of a frames directory's metadata file.
+
+    The file holds a "Frame: <frame>" line before the caption text of each
+    frame.
+
+    Args:
+        content: Contents of the metadata file
+
+    Returns:
+        Dictionary mapping frame names to caption text
+    """
+    metadata: dict[str, str] = {}
+    # Text before the first "Frame:" line does not belong to any frame
+    for chunk in _METADATA_FRAME_RE.split(content)[1:]:
+        frame, _, body = chunk.partition("\n")
+        text = "\n".join(line.strip() for line in body.strip().splitlines())
+        if frame.strip() and text:
+            metadata[frame.strip()] = text
+    return metadata
 
 
 def load_segments_from_frames_dir(
@@ -282,61 +577,41 @@ def load_segments_from_frames_dir(
     Returns:
         List of WWDCFrameSegment objects
     """
-    logger.info(f"Loading existing frames from {frames_dir}")
+    logger.info("Loading existing frames from %s", frames_dir)
     segments = []
 
-    if not os.path.exists(frames_dir) or not os.path.isdir(frames_dir):
-        logger.warning(f"Frames directory does not exist: {frames_dir}")
+    # Find all frame images in the directory, in frame number order
+    try:
+        with os.scandir(frames_dir) as entries:
+            image_files = [
+                (int(match.group(1)), match.group(1), entry.name)
+                for entry in entries
+                if (match := _FRAME_FILENAME_RE.fullmatch(entry.name))
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        logger.warning("Frames directory does not exist: %s", frames_dir)
         return segments
-
-    # Find all image files in the directory
-    image_extensions = (".jpg", ".jpeg", ".png", ".avif", ".webp")
-    image_files = [
-        f
-        for f in sorted(os.listdir(frames_dir))
-        if f.lower().startswith("frame_") and f.lower().endswith(image_extensions)
-    ]
+    image_files.sort()
 
     if not image_files:
-        logger.warning(f"No frame images found in {frames_dir}")
+        logger.warning("No frame images found in %s", frames_dir)
         return segments
 
     # Load metadata file if it exists
     metadata_path = os.path.join(frames_dir, "metadata.txt")
     metadata = {}
 
-    if os.path.exists(metadata_path):
-        try:
-            with open(metadata_path, encoding="utf-8") as file:
-                lines = file.readlines()
-                current_frame = None
-                current_text = []
-
-                for line_text in lines:
-                    line_content = line_text.strip()
-                    if line_content.startswith("Frame:"):
-                        # Save previous frame data if exists
-                        if current_frame and current_text:
-                            metadata[current_frame] = "\n".join(current_text)
-                            current_text = []
-
-                        # Start new frame
-                        current_frame = line_content.replace("Frame:", "").strip()
-                    elif current_frame:
-                        current_text.append(line_content)
-
-                # Save last frame
-                if current_frame and current_text:
-                    metadata[current_frame] = "\n".join(current_text)
-        except Exception as e:
-            logger.error(f"Error reading metadata file: {e}")
+    try:
+        with open(metadata_path, encoding="utf-8") as file:
+            metadata = _parse_frame_metadata(file.read())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error("Error reading metadata file: %s", e)
 
     # Process each image file
-    for img_file in image_files:
+    for frame_num, frame_number, img_file in image_files:
         try:
-            # Extract frame number from filename (frame_XXXX.ext)
-            frame_number = img_file.split("_")[1].split(".")[0]
-
             # Full path to the image
             image_path = os.path.join(frames_dir, img_file)
 
@@ -346,7 +621,6 @@ def load_segments_from_frames_dir(
             )
 
             # Create timestamp (use frame number as timestamp if not available)
-            frame_num = int(frame_number)
             timestamp = f"{frame_num // 60:02d}:{frame_num % 60:02d}.000"
 
             # Create segment
@@ -357,7 +631,7 @@ def load_segments_from_frames_dir(
             segments.append(segment)
 
         except Exception as e:
-            logger.warning(f"Error processing frame file {img_file}: {e}")
+            logger.warning("Error processing frame file %s: %s", img_file, e)
 
-    logger.info(f"Loaded {len(segments)} frames from directory")
+    logger.info("Loaded %s frames from directory", len(segments))
     return segments
@@ -1,9 +1,14 @@
 """Implementations of video processing components."""
 
+import asyncio
 import logging
 
 from .models import ImageOptions, WWDCFrameSegment
-from .video import extract_frames_from_video, load_segments_from_frames_dir
+from .video import (
+    extract_frames_from_video,
+    get_encode_executor,
+    load_segments_from_frames_dir,
+)
 
 logger = logging.getLogger("wwdcdigest")
 
@@ -29,9 +34,16 @@ class DefaultVideoProcessor:
         Returns:
             List of WWDCFrameSegment objects
         """
-        logger.info(f"Extracting frames from {video_path} to {output_dir}")
-        return extract_frames_from_video(
-            video_path, subtitle_path, output_dir, image_options
+        logger.info("Extracting frames from %s to %s", video_path, output_dir)
+        # Decoding is blocking, so keep it off the event loop; frames are
+        # encoded in parallel by the shared process pool
+        return await asyncio.to_thread(
+            extract_frames_from_video,
+            video_path,
+            subtitle_path,
+            output_dir,
+            image_options,
+            encode_executor=get_encode_executor(),
         )
 
     async def load_segments_from_frames(
@@ -46,4 +58,4 @@ class DefaultVideoProcessor:
         Returns:
             List of WWDCFrameSegment objects
         """
-        return load_segments_from_frames_dir(frames_dir)
+        return await asyncio.to_thread(load_segments_from_frames_dir, frames_dir)
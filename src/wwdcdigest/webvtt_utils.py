@@ -3,6 +3,7 @@
 import logging
 import os
 import re
+from collections.abc import Iterator
 
 import webvtt
 from wwdctools import combine_webvtt_files
@@ -50,11 +51,12 @@ def prepare_combined_subtitle(subtitle_path: str, output_dir: str) -> str:
         combine_webvtt_files([subtitle_path], combined_subtitle_path)
     else:
         # If it's a directory, find all WebVTT files and combine them
-        webvtt_files = [
-            os.path.join(subtitle_path, f)
-            for f in os.listdir(subtitle_path)
-            if f.endswith((".webvtt", ".vtt"))
-        ]
+        with os.scandir(subtitle_path) as entries:
+            webvtt_files = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith((".webvtt", ".vtt")) and entry.is_file()
+            ]
         if webvtt_files:
             combine_webvtt_files(webvtt_files, combined_subtitle_path)
         else:
@@ -64,6 +66,37 @@ def prepare_combined_subtitle(subtitle_path: str, output_dir: str) -> str:
     return combined_subtitle_path
 
 
+def _iter_caption_blocks(file_path: str) -> Iterator[str]:
+    """Stream the caption blocks of a WebVTT file.
+
+    The file is read line by line, and the WEBVTT header block is skipped.
+
+    Args:
+        file_path: Path to the WebVTT file
+
+    Yields:
+        Each blank-line separated block, with its lines joined by newlines
+    """
+    with open(file_path, encoding="utf-8") as infile:
+        in_header = False
+        block: list[str] = []
+        for i, raw_line in enumerate(infile):
+            line = raw_line.rstrip("\r\n")
+            if i == 0 and line.startswith("WEBVTT"):
+                in_header = True
+            if line.strip() == "":
+                if block and not in_header:
+                    yield "\n".join(block)
+                in_header = False
+                block = []
+            elif not in_header:
+                block.append(line)
+
+        # Yield any remaining caption
+        if block and not in_header:
+            yield "\n".join(block)
+
+
 def prepare_subtitle_path(subtitle_path: str, output_dir: str) -> str:
     """Prepare subtitle path, combining WebVTT files if needed.
 
@@ -78,14 +111,17 @@ def prepare_subtitle_path(subtitle_path: str, output_dir: str) -> str:
 
     # If subtitle_path is a directory with multiple .webvtt files, combine them
     if os.path.isdir(subtitle_path):
-        logger.debug(f"Combining WebVTT files from {subtitle_path}")
+        logger.debug("Combining WebVTT files from %s", subtitle_path)
         with open(combined_subtitle_path, "w", encoding="utf-8") as outfile:
             outfile.write("WEBVTT\n\n")
 
             # Sort by sequence number (sequence_1.webvtt, sequence_2.webvtt, ...)
-            webvtt_files = [
-                f for f in os.listdir(subtitle_path) if f.endswith(".webvtt")
-            ]
+            with os.scandir(subtitle_path) as entries:
+                webvtt_files = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(".webvtt") and entry.is_file()
+                ]
 
             def get_sequence_number(filename: str) -> int:
                 match = re.search(r"sequence_(\d+)", filename)
@@ -94,47 +130,18 @@ def prepare_subtitle_path(subtitle_path: str, output_dir: str) -> str:
             sorted_files = sorted(webvtt_files, key=get_sequence_number)
 
             # Track unique captions to avoid duplicates
-            unique_captions = set()
+            unique_captions: set[str] = set()
 
             for filename in sorted_files:
                 file_path = os.path.join(subtitle_path, filename)
-                with open(file_path, encoding="utf-8") as infile:
-                    content = infile.read()
-                    # Remove header if present
-                    if content.startswith("WEBVTT"):
-                        content = re.sub(
-                            r"^WEBVTT.*?\n\n", "", content, flags=re.DOTALL
-                        )
-
-                    # Parse and deduplicate captions
-                    captions = []
-                    current_caption = []
-
-                    for line in content.splitlines():
-                        if line.strip() == "":
-                            if current_caption:
-                                caption_text = "\n".join(current_caption)
-                                if caption_text not in unique_captions:
-                                    unique_captions.add(caption_text)
-                                    captions.append(caption_text)
-                                current_caption = []
-                        else:
-                            current_caption.append(line)
-
-                    # Add any remaining caption
-                    if current_caption:
-                        caption_text = "\n".join(current_caption)
-                        if caption_text not in unique_captions:
-                            unique_captions.add(caption_text)
-                            captions.append(caption_text)
-
-                    # Write unique captions to the output file
-                    for caption in captions:
-                        outfile.write(caption)
+                for caption_text in _iter_caption_blocks(file_path):
+                    if caption_text not in unique_captions:
+                        unique_captions.add(caption_text)
+                        outfile.write(caption_text)
                         outfile.write("\n\n")
 
         logger.debug(
-            f"Created combined WebVTT file with {len(unique_captions)} unique captions"
+            "Created combined WebVTT file with %s unique captions", len(unique_captions)
         )
         return combined_subtitle_path
 
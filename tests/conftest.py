@@ -0,0 +1,71 @@
+"""Shared fixtures for the wwdcdigest tests.
+
+Tests run under pytest-xdist, so session-scoped fixtures are built once per
+worker. They only hold cheap, immutable inputs and must not rely on running
+once per test run.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from wwdcdigest import _translate_cache
+from wwdcdigest.models import OpenAIConfig
+
+
+@pytest.fixture(autouse=True)
+def isolated_translation_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    """Point the shared translation cache at a fresh directory for every test."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("WWDCDIGEST_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(_translate_cache, "_default_cache", None)
+    monkeypatch.setattr(_translate_cache, "_default_cache_failed", False)
+    yield cache_dir
+    if _translate_cache._default_cache is not None:
+        _translate_cache._default_cache.close()
+
+
+@pytest.fixture(scope="session")
+def black_frame() -> np.ndarray:
+    """A black 8x8 BGR frame shared by the whole session."""
+    return np.zeros((8, 8, 3), dtype=np.uint8)
+
+
+@pytest.fixture(scope="session")
+def white_frame() -> np.ndarray:
+    """A white 8x8 BGR frame shared by the whole session."""
+    return np.full((8, 8, 3), 255, dtype=np.uint8)
+
+
+@pytest.fixture(scope="session")
+def black_jpg_path(
+    tmp_path_factory: pytest.TempPathFactory, black_frame: np.ndarray
+) -> str:
+    """The black frame encoded once as a JPEG file.
+
+    Tests that modify the file should copy it into their own tmp_path first.
+    """
+    path = tmp_path_factory.mktemp("imgs") / "black.jpg"
+    cv2.imwrite(str(path), black_frame)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def white_jpg_path(
+    tmp_path_factory: pytest.TempPathFactory, white_frame: np.ndarray
+) -> str:
+    """The white frame encoded once as a JPEG file."""
+    path = tmp_path_factory.mktemp("imgs") / "white.jpg"
+    cv2.imwrite(str(path), white_frame)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def openai_config() -> OpenAIConfig:
+    """An OpenAI configuration with a test API key shared by the whole session."""
+    return OpenAIConfig(api_key="test-key")
@@ -1,14 +1,44 @@
 """Tests for the digest module."""
 
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 from wwdctools.models import WWDCSession
 
-from wwdcdigest.digest import create_digest
-from wwdcdigest.models import OpenAIConfig, WWDCDigest
+from wwdcdigest._http import close_http_client, get_http_client
+from wwdcdigest.digest import (
+    SessionPaths,
+    _chunk_transcript,
+    _flatten_nested_directory,
+    _handle_file_move,
+    _load_manifest,
+    _load_segments_sidecar,
+    _make_temp_output_dir,
+    _prepare_options,
+    _read_text,
+    _save_manifest,
+    _save_segments_sidecar,
+    _stat_existing_content,
+    _summarize_transcript,
+    _temp_output_parent,
+    create_digest,
+    create_digest_from_url,
+    create_digests,
+)
+from wwdcdigest.models import (
+    AIConfig,
+    DigestOptions,
+    OpenAIConfig,
+    WWDCDigest,
+    WWDCFrameSegment,
+)
 
 
-@pytest.mark.anyio
-async def test_wwdc_digest_model():
+def test_wwdc_digest_model():
     """Test the WWDCDigest model."""
     # Create a test session
     session = WWDCSession(
@@ -40,8 +70,464 @@ async def test_wwdc_digest_model():
     assert str(digest) == "Test Session (110173)"
 
 
+@pytest.mark.asyncio
+async def test_handle_file_move_renames_directory(tmp_path: Path):
+    """Test moving a directory to a target that doesn't exist yet."""
+    old_dir = tmp_path / "downloaded"
+    old_dir.mkdir()
+    (old_dir / "sequence_1.webvtt").write_text("WEBVTT")
+    expected_dir = tmp_path / "webvtt"
+
+    result = await _handle_file_move(str(old_dir), str(expected_dir), is_dir=True)
+
+    assert result == str(expected_dir)
+    assert (expected_dir / "sequence_1.webvtt").exists()
+    assert not old_dir.exists()
+
+
+@pytest.mark.asyncio
+async def test_handle_file_move_replaces_existing_file(tmp_path: Path):
+    """Test that moving a file overwrites an existing file at the target."""
+    old_path = tmp_path / "downloaded.txt"
+    old_path.write_text("new")
+    expected_path = tmp_path / "transcript.txt"
+    expected_path.write_text("old")
+
+    result = await _handle_file_move(str(old_path), str(expected_path))
+
+    assert result == str(expected_path)
+    assert expected_path.read_text() == "new"
+    assert not old_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_handle_file_move_missing_source(tmp_path: Path):
+    """Test that a missing source path is returned unchanged."""
+    old_path = str(tmp_path / "missing.txt")
+
+    result = await _handle_file_move(old_path, str(tmp_path / "transcript.txt"))
+
+    assert result == old_path
+
+
+@pytest.mark.asyncio
+async def test_handle_file_move_merges_into_existing_directory(tmp_path: Path):
+    """Test moving a directory into a target directory that has content."""
+    old_dir = tmp_path / "downloaded"
+    old_dir.mkdir()
+    (old_dir / "sequence_2.webvtt").write_text("WEBVTT")
+    expected_dir = tmp_path / "webvtt"
+    expected_dir.mkdir()
+    (expected_dir / "sequence_1.webvtt").write_text("WEBVTT")
+
+    result = await _handle_file_move(str(old_dir), str(expected_dir), is_dir=True)
+
+    assert result == str(expected_dir)
+    assert sorted(p.name for p in expected_dir.iterdir()) == [
+        "sequence_1.webvtt",
+        "sequence_2.webvtt",
+    ]
+    assert not old_dir.exists()
+
+
+def test_stat_existing_content(tmp_path: Path):
+    """Test detecting previously downloaded content in a session directory."""
+    session = WWDCSession(
+        id="10149",
+        title="Test Session",
+        description="Test description",
+        year=2023,
+        url="https://developer.apple.com/videos/play/wwdc2023/10149/",
+    )
+    paths = SessionPaths.for_session(str(tmp_path), session)
+    (tmp_path / "hd.mp4").write_bytes(b"video")
+    (tmp_path / "webvtt").mkdir()
+    (tmp_path / "webvtt" / "sequence_0.webvtt").write_text("WEBVTT")
+    (tmp_path / "frames").mkdir()
+
+    assert _stat_existing_content(paths) == (True, True, False, False)
+
+    (tmp_path / "transcript.txt").write_text("Hello")
+    (tmp_path / "frames" / "frame_0000.avif").write_bytes(b"")
+
+    assert _stat_existing_content(paths) == (True, True, True, True)
+
+
+def test_manifest_round_trip(tmp_path: Path):
+    """Test that a manifest is only trusted while the content is unchanged."""
+    video_path = tmp_path / "hd.mp4"
+    video_path.write_bytes(b"video")
+    webvtt_dir = tmp_path / "webvtt"
+    webvtt_dir.mkdir()
+    download_paths = {"video": str(video_path), "webvtt": str(webvtt_dir)}
+    manifest_path = str(tmp_path / "manifest.json")
+
+    _save_manifest(manifest_path, download_paths)
+    assert _load_manifest(manifest_path) == download_paths
+
+    # Modifying the video invalidates the manifest
+    os.utime(video_path, ns=(0, 0))
+    assert _load_manifest(manifest_path) is None
+
+
+def test_load_manifest_missing(tmp_path: Path):
+    """Test that a missing manifest falls back to scanning."""
+    assert _load_manifest(str(tmp_path / "manifest.json")) is None
+
+
+def test_flatten_nested_directory(tmp_path: Path):
+    """Test moving downloaded files out of a nested session directory."""
+    nested_dir = tmp_path / "wwdc_2023_10149"
+    nested_dir.mkdir()
+    (nested_dir / "hd.mp4").write_bytes(b"video")
+    (nested_dir / "transcript.txt").write_text("new")
+    (tmp_path / "transcript.txt").write_text("existing")
+    download_paths = {
+        "video": str(nested_dir / "hd.mp4"),
+        "transcript": str(nested_dir / "transcript.txt"),
+    }
+
+    _flatten_nested_directory(str(nested_dir), str(tmp_path), download_paths)
+
+    assert not nested_dir.exists()
+    assert download_paths["video"] == str(tmp_path / "hd.mp4")
+    assert (tmp_path / "hd.mp4").read_bytes() == b"video"
+    # Files already present in the parent are kept
+    assert (tmp_path / "transcript.txt").read_text() == "existing"
+
+
+def test_chunk_transcript_splits_at_sentence_boundaries():
+    """Test that transcript chunks respect the size limit and sentences."""
+    transcript = "\n".join(f"Sentence number {i}." for i in range(100))
+    chunks = _chunk_transcript(transcript, max_chars=200)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 200 for chunk in chunks)
+    assert "\n".join(chunks) == transcript
+
+    long_line = " ".join(f"Sentence number {i}." for i in range(100))
+    chunks = _chunk_transcript(long_line, max_chars=200)
+    assert all(chunk.endswith(".") for chunk in chunks)
+
+
+@pytest.mark.asyncio
+async def test_summarize_transcript_map_reduce():
+    """Test that long transcripts are summarized per chunk and then merged."""
+    calls: list[tuple[str, str, str]] = []
+
+    class FakeSummarizer:
+        async def generate_summary(
+            self, transcript: str, session_title: str, language: str = "en"
+        ) -> tuple[str, list[str]]:
+            calls.append((transcript, session_title, language))
+            return f"summary {len(calls)}", [f"point {len(calls)}"]
+
+    short_result = await _summarize_transcript(
+        FakeSummarizer(), "Short transcript.", "Title", "en"
+    )
+    assert short_result == ("summary 1", ["point 1"])
+
+    calls.clear()
+    transcript = "\n".join(["A" * 20000, "B" * 20000])
+    summary, key_points = await _summarize_transcript(
+        FakeSummarizer(), transcript, "Title", "en"
+    )
+
+    # Two chunk summaries followed by the reduce call
+    assert len(calls) == 3
+    assert "- point 1" in calls[2][0]
+    assert "- point 2" in calls[2][0]
+    assert all(call[1:] == ("Title", "en") for call in calls)
+    assert (summary, key_points) == ("summary 3", ["point 3"])
+
+
+def test_segments_sidecar_round_trip(tmp_path: Path):
+    """Test that saved segments are loaded back while their frames exist."""
+    image_path = tmp_path / "frame_0000.jpg"
+    image_path.write_bytes(b"")
+    segments = [
+        WWDCFrameSegment(
+            timestamp="00:00:01.000", text="Hello", image_path=str(image_path)
+        )
+    ]
+    sidecar_path = str(tmp_path / "segments.json")
+
+    _save_segments_sidecar(sidecar_path, segments)
+    assert _load_segments_sidecar(sidecar_path) == segments
+
+    # A missing frame invalidates the sidecar
+    image_path.unlink()
+    assert _load_segments_sidecar(sidecar_path) is None
+
+
+def test_segments_sidecar_missing_or_invalid(tmp_path: Path):
+    """Test that a missing or malformed sidecar is ignored."""
+    sidecar_path = tmp_path / "segments.json"
+    assert _load_segments_sidecar(str(sidecar_path)) is None
+
+    sidecar_path.write_text("not json")
+    assert _load_segments_sidecar(str(sidecar_path)) is None
+
+
+def test_temp_output_parent_requires_opt_in(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that SHM_DIR is only used when WWDCDIGEST_USE_SHM is set."""
+    monkeypatch.setattr("wwdcdigest.digest.SHM_DIR", str(tmp_path))
+    monkeypatch.setattr("wwdcdigest.digest.MIN_SHM_FREE_BYTES", 0)
+
+    monkeypatch.delenv("WWDCDIGEST_USE_SHM", raising=False)
+    assert _temp_output_parent() is None
+
+    monkeypatch.setenv("WWDCDIGEST_USE_SHM", "1")
+    assert _temp_output_parent() == str(tmp_path)
+
+    monkeypatch.setattr("wwdcdigest.digest.SHM_DIR", str(tmp_path / "missing"))
+    assert _temp_output_parent() is None
+
+
+def test_make_temp_output_dir_falls_back_to_disk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that failing to create a directory in SHM_DIR falls back to disk."""
+    shm_dir = str(tmp_path / "shm")
+    monkeypatch.setattr("wwdcdigest.digest._temp_output_parent", lambda: shm_dir)
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    mkdtemp = tempfile.mkdtemp
+
+    def failing_mkdtemp(prefix: str, dir: str | None = None) -> str:
+        if dir == shm_dir:
+            raise OSError(28, "No space left on device")
+        return mkdtemp(prefix=prefix, dir=dir)
+
+    with patch("wwdcdigest.digest.tempfile.mkdtemp", side_effect=failing_mkdtemp):
+        output_dir = _make_temp_output_dir()
+
+    assert Path(output_dir).parent == tmp_path
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url",
+    [
+        "developer.apple.com/videos/play/wwdc2023/10149/",
+        "https://example.com/videos/play/wwdc2023/10149/",
+        "https://developer.apple.com/videos/play/tech-talks/",
+    ],
+)
+async def test_create_digest_rejects_invalid_url(url: str):
+    """Test that URLs other than Apple Developer video pages are rejected."""
+    with pytest.raises(ValueError, match="valid WWDC session URL"):
+        await create_digest(url)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://developer.apple.com/videos/play/wwdc2023/10149/",
+        "https://developer.apple.com/jp/videos/play/wwdc2023/10149/",
+        "https://developer.apple.com/videos/play/tech-talks/10149/",
+    ],
+)
+def test_prepare_options_accepts_video_urls(url: str):
+    """Test that WWDC and tech talk session URLs are accepted."""
+    options = _prepare_options(
+        [url], DigestOptions(ai_config=AIConfig(provider="none"))
+    )
+    assert options.ai_config is None
+
+
+@pytest.mark.asyncio
+async def test_create_digests_bounds_concurrency():
+    """Test that sessions run concurrently up to the limit, in input order."""
+    urls = [
+        f"https://developer.apple.com/videos/play/wwdc2023/{10000 + i}/"
+        for i in range(6)
+    ]
+    running = 0
+    max_running = 0
+
+    async def fake_create_digest_from_url(url: str, options: object) -> str:  # noqa: ARG001
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return url
+
+    with patch(
+        "wwdcdigest.digest.create_digest_from_url",
+        side_effect=fake_create_digest_from_url,
+    ):
+        digests = await create_digests(urls, concurrency=2)
+
+    assert digests == urls
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_create_digest_overlapping_calls_share_open_client():
+    """Test that a finished digest does not close the client of a running one."""
+    urls = [
+        "https://developer.apple.com/videos/play/wwdc2023/10001/",
+        "https://developer.apple.com/videos/play/wwdc2023/10002/",
+    ]
+    first_done = asyncio.Event()
+
+    async def fake_create_digest_from_url(url: str, options: object) -> str:  # noqa: ARG001
+        client = get_http_client()
+        if url == urls[0]:
+            first_done.set()
+        else:
+            # Still in flight after the first call has returned
+            await first_done.wait()
+            await asyncio.sleep(0)
+        assert not client.is_closed
+        assert get_http_client() is client
+        return url
+
+    try:
+        with patch(
+            "wwdcdigest.digest.create_digest_from_url",
+            side_effect=fake_create_digest_from_url,
+        ):
+            digests = await asyncio.gather(*[create_digest(url) for url in urls])
+    finally:
+        await close_http_client()
+
+    assert digests == urls
+
+
+@pytest.mark.asyncio
+async def test_create_digests_closes_client_after_failing_session():
+    """Test that the client is closed only once every session has settled."""
+    urls = [
+        "https://developer.apple.com/videos/play/wwdc2023/10001/",
+        "https://developer.apple.com/videos/play/wwdc2023/10002/",
+    ]
+    states: list[bool] = []
+
+    async def fake_create_digest_from_url(url: str, options: object) -> str:  # noqa: ARG001
+        client = get_http_client()
+        if url == urls[0]:
+            raise RuntimeError("download failed")
+        await asyncio.sleep(0.01)
+        states.append(client.is_closed)
+        return url
+
+    with (
+        patch(
+            "wwdcdigest.digest.create_digest_from_url",
+            side_effect=fake_create_digest_from_url,
+        ),
+        pytest.raises(RuntimeError, match="download failed"),
+    ):
+        await create_digests(urls)
+
+    assert states == [False]
+
+
+@pytest.mark.asyncio
+async def test_create_digests_rejects_invalid_url():
+    """Test that every URL is validated before any session is processed."""
+    urls = [
+        "https://developer.apple.com/videos/play/wwdc2023/10149/",
+        "https://example.com/videos/play/wwdc2023/10149/",
+    ]
+    with (
+        patch("wwdcdigest.digest.create_digest_from_url") as mock_create,
+        pytest.raises(ValueError, match="valid WWDC session URL"),
+    ):
+        await create_digests(urls)
+    mock_create.assert_not_called()
+
+
+async def _run_create_digest_from_url(
+    tmp_path: Path, transcript: str | None
+) -> list[str]:
+    """Run create_digest_from_url with stubbed I/O.
+
+    Args:
+        tmp_path: Directory for the session output
+        transcript: Transcript file content, or None if there is no transcript
+
+    Returns:
+        The transcript text passed to each summary generation call
+    """
+    url = "https://developer.apple.com/videos/play/wwdc2023/10149/"
+    session = WWDCSession(
+        id="10149", title="Test Session", description="", year=2023, url=url
+    )
+    paths = SessionPaths.for_session(str(tmp_path), session)
+    download_paths = {"video": str(tmp_path / "video.mp4")}
+    if transcript is not None:
+        transcript_path = tmp_path / "transcript.txt"
+        transcript_path.write_text(transcript)
+        download_paths["transcript"] = str(transcript_path)
+    segments = [
+        WWDCFrameSegment(
+            timestamp="00:00:01.000",
+            text="Hello",
+            image_path=str(tmp_path / "frame.jpg"),
+        )
+    ]
+    summary_transcripts: list[str] = []
+
+    async def fake_extract_segments(*args: object) -> list[WWDCFrameSegment]:  # noqa: ARG001
+        return segments
+
+    async def fake_generate_summary(
+        config: object,  # noqa: ARG001
+        transcript_text: str,
+        *args: object,  # noqa: ARG001
+    ) -> tuple[str, list[str]]:
+        summary_transcripts.append(transcript_text)
+        return "Summary", []
+
+    with (
+        patch("wwdcdigest.digest.fetch_session_data", return_value=session),
+        patch("wwdcdigest.digest._setup_output_directory", return_value=(paths, "")),
+        patch(
+            "wwdcdigest.digest._download_content",
+            return_value=(download_paths, False),
+        ),
+        patch("wwdcdigest.digest._extract_segments", side_effect=fake_extract_segments),
+        patch(
+            "wwdcdigest.digest._generate_summary_and_key_points",
+            side_effect=fake_generate_summary,
+        ),
+        patch("wwdcdigest.digest.DigestComponentFactory.create_formatter"),
+        patch("wwdcdigest.digest._read_text", wraps=_read_text) as read_text,
+    ):
+        digest = await create_digest_from_url(url, DigestOptions())
+
+    assert digest.segments == segments
+    # The transcript file is read once and shared with the summary
+    assert read_text.call_count == (transcript is not None)
+    return summary_transcripts
+
+
+@pytest.mark.asyncio
+async def test_create_digest_from_url_summarizes_transcript_in_parallel(
+    tmp_path: Path,
+):
+    """Test that a transcript is summarized without waiting for the segments."""
+    summary_transcripts = await _run_create_digest_from_url(tmp_path, "Hello world")
+    assert summary_transcripts == ["Hello world"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transcript", [None, "", "  \n"])
+async def test_create_digest_from_url_summarizes_segments_without_transcript(
+    tmp_path: Path, transcript: str | None
+):
+    """Test that the summary uses the segments when there is no transcript text."""
+    summary_transcripts = await _run_create_digest_from_url(tmp_path, transcript)
+    assert summary_transcripts == ["Hello"]
+
+
 # Test will be implemented when the actual digest creation logic is implemented
-@pytest.mark.anyio
+@pytest.mark.asyncio
 @pytest.mark.skip(reason="Requires internet connection and actual WWDC session data")
 async def test_create_digest():
     """Test creating a digest from a session URL."""
@@ -55,7 +541,7 @@ async def test_create_digest():
     assert len(digest.key_points) == 0
 
 
-@pytest.mark.anyio
+@pytest.mark.asyncio
 @pytest.mark.skip(
     reason="Requires internet connection, actual WWDC session data, and OpenAI key"
 )
@@ -26,10 +26,9 @@ def test_create_summarizer_default():
     assert isinstance(summarizer, DefaultSummarizer)
 
 
-def test_create_summarizer_openai():
+def test_create_summarizer_openai(openai_config: OpenAIConfig):
     """Test creating an OpenAI summarizer."""
-    config = OpenAIConfig(api_key="test-key")
-    summarizer = DigestComponentFactory.create_summarizer(config)
+    summarizer = DigestComponentFactory.create_summarizer(openai_config)
     assert isinstance(summarizer, OpenAIContentSummarizer)
 
 
@@ -40,10 +39,9 @@ def test_create_summarizer_codex():
     assert isinstance(summarizer, ExternalAIContentSummarizer)
 
 
-def test_create_translator():
+def test_create_translator(openai_config: OpenAIConfig):
     """Test creating a translator."""
-    config = OpenAIConfig(api_key="test-key")
-    translator = DigestComponentFactory.create_translator(config)
+    translator = DigestComponentFactory.create_translator(openai_config)
     assert isinstance(translator, OpenAIContentTranslator)
 
 
@@ -1,7 +1,7 @@
 """Tests for the formatter module."""
 
 import os
-import tempfile
+from pathlib import Path
 
 import pytest
 from wwdctools.models import WWDCSession
@@ -10,70 +10,73 @@ from wwdcdigest.formatter import MarkdownFormatter
 from wwdcdigest.models import WWDCDigest, WWDCFrameSegment
 
 
-@pytest.mark.anyio
-async def test_markdown_formatter():
+@pytest.fixture(scope="session")
+def formatter() -> MarkdownFormatter:
+    """A MarkdownFormatter shared by the whole session."""
+    return MarkdownFormatter()
+
+
+def test_markdown_formatter(tmp_path: Path, formatter: MarkdownFormatter):
     """Test the MarkdownFormatter."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create test data
-        output_path = os.path.join(temp_dir, "test_digest.md")
+    # Create test data
+    output_path = str(tmp_path / "test_digest.md")
 
-        # Create test frames
-        segments = [
-            WWDCFrameSegment(
-                timestamp="00:01:23.456",
-                text="This is the first segment",
-                image_path=os.path.join(temp_dir, "frame1.jpg"),
-            ),
-            WWDCFrameSegment(
-                timestamp="00:02:34.567",
-                text="This is the second segment",
-                image_path=os.path.join(temp_dir, "frame2.jpg"),
-            ),
-        ]
+    # Create test frames
+    segments = [
+        WWDCFrameSegment(
+            timestamp="00:01:23.456",
+            text="This is the first segment",
+            image_path=str(tmp_path / "frame1.jpg"),
+        ),
+        WWDCFrameSegment(
+            timestamp="00:02:34.567",
+            text="This is the second segment",
+            image_path=str(tmp_path / "frame2.jpg"),
+        ),
+    ]
 
-        # Create test files to ensure the image paths exist
-        for segment in segments:
-            with open(segment.image_path, "w") as f:
-                f.write("test image data")
+    # Create test files to ensure the image paths exist
+    for segment in segments:
+        with open(segment.image_path, "w") as f:
+            f.write("test image data")
 
-        # Create digest
-        session = WWDCSession(
-            id="12345",
-            title="Test Session",
-            description="Test description",
-            year=2023,
-            url="https://example.com/test",
-        )
+    # Create digest
+    session = WWDCSession(
+        id="12345",
+        title="Test Session",
+        description="Test description",
+        year=2023,
+        url="https://example.com/test",
+    )
 
-        digest = WWDCDigest(
-            session=session,
-            summary="This is a test summary",
-            key_points=["Point 1", "Point 2", "Point 3"],
-            segments=segments,
-            source_url="https://example.com/test",
-        )
+    digest = WWDCDigest(
+        session=session,
+        summary="This is a test summary",
+        key_points=["Point 1", "Point 2", "Point 3"],
+        segments=segments,
+        source_url="https://example.com/test",
+    )
 
-        # Create formatter and format digest
-        formatter = MarkdownFormatter()
-        result_path = formatter.format_digest(digest, output_path)
+    # Format digest
+    result_path = formatter.format_digest(digest, output_path)
 
-        # Check that the file was created
-        assert os.path.exists(result_path)
-        assert result_path == output_path
+    # Check that the file was created
+    assert os.path.exists(result_path)
+    assert result_path == output_path
 
-        # Check the content of the file
-        with open(result_path, encoding="utf-8") as f:
-            content = f.read()
+    # Check the content of the file
+    with open(result_path, encoding="utf-8") as f:
+        content = f.read()
 
-            # Check that all expected elements are in the content
-            assert "# Test Session" in content
-            assert "This is a test summary" in content
-            assert "- Point 1" in content
-            assert "- Point 2" in content
-            assert "- Point 3" in content
-            assert "This is the first segment" in content
-            assert "This is the second segment" in content
-            assert "frame1.jpg" in content
-            assert "frame2.jpg" in content
-            assert "00:01:23.456" in content
-            assert "00:02:34.567" in content
+        # Check that all expected elements are in the content
+        assert "# Test Session" in content
+        assert "This is a test summary" in content
+        assert "- Point 1" in content
+        assert "- Point 2" in content
+        assert "- Point 3" in content
+        assert "This is the first segment" in content
+        assert "This is the second segment" in content
+        assert "frame1.jpg" in content
+        assert "frame2.jpg" in content
+        assert "00:01:23.456" in content
+        assert "00:02:34.567" in content
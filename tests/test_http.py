@@ -0,0 +1,54 @@
+"""Tests for the shared HTTP client."""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+import httpx
+
+from wwdcdigest._http import close_http_client, get_http_client
+
+
+def _run_in_new_loop[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine in a fresh event loop that is closed afterwards.
+
+    Unlike asyncio.run, this leaves the current event loop of the thread (the
+    session loop of pytest-asyncio) untouched.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def _get_client() -> httpx.AsyncClient:
+    return get_http_client()
+
+
+def test_http_client_is_rebuilt_for_each_event_loop():
+    """Test that a client left open by an earlier loop is not reused."""
+    first = _run_in_new_loop(_get_client())
+    second = _run_in_new_loop(_get_client())
+
+    assert second is not first
+    assert not second.is_closed
+
+    # The client of the earlier, closed loop is dropped instead of closed
+    _run_in_new_loop(close_http_client())
+    assert not second.is_closed
+
+
+def test_http_client_is_shared_within_an_event_loop():
+    """Test that one loop reuses its client until it is closed."""
+
+    async def run() -> None:
+        client = get_http_client()
+        assert get_http_client() is client
+
+        await close_http_client()
+        assert client.is_closed
+        assert get_http_client() is not client
+        await close_http_client()
+
+    _run_in_new_loop(run())
@@ -1,14 +1,32 @@
 """Tests for OpenAI configuration utilities."""
 
-import os
-from unittest.mock import patch
+from collections.abc import Iterator
 
 import pytest
 
 from wwdcdigest.digest import _validate_ai_settings, _validate_openai_settings
 from wwdcdigest.models import AIConfig, OpenAIConfig
 
+OPENAI_ENV_VARS = ("OPENAI_API_KEY", "OPENAI_API_ENDPOINT")
 
+
+@pytest.fixture(scope="module")
+def openai_env() -> Iterator[None]:
+    """Set the OpenAI environment variables once for the whole module."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("OPENAI_API_KEY", "env-key")
+        monkeypatch.setenv("OPENAI_API_ENDPOINT", "env-endpoint")
+        yield
+
+
+@pytest.fixture
+def no_openai_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Remove the OpenAI environment variables for a single test."""
+    for name in OPENAI_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.mark.usefixtures("no_openai_env")
 def test_validate_openai_settings_with_params():
     """Test validating OpenAI settings with explicit parameters."""
     # Test with both key and endpoint provided
@@ -26,9 +44,7 @@ def test_validate_openai_settings_with_params():
     assert config.endpoint is None
 
 
-@patch.dict(
-    os.environ, {"OPENAI_API_KEY": "env-key", "OPENAI_API_ENDPOINT": "env-endpoint"}
-)
+@pytest.mark.usefixtures("openai_env")
 def test_validate_openai_settings_with_env_vars():
     """Test validating OpenAI settings with environment variables."""
     # Test with environment variables
@@ -38,6 +54,7 @@ def test_validate_openai_settings_with_env_vars():
     assert config.endpoint == "env-endpoint"
 
 
+@pytest.mark.usefixtures("no_openai_env")
 def test_validate_openai_settings_non_english_no_key():
     """Test that an error is raised when requesting non-English without an API key."""
     with pytest.raises(
@@ -46,6 +63,7 @@ def test_validate_openai_settings_non_english_no_key():
         _validate_openai_settings(None, "ja")
 
 
+@pytest.mark.usefixtures("no_openai_env")
 def test_validate_openai_settings_english_no_key():
     """Test that None is returned for English with no API key."""
     config = _validate_openai_settings(None, "en")
@@ -59,7 +77,7 @@ def test_validate_ai_settings_codex_non_english():
     assert config.provider == "codex"
 
 
-@patch.dict(os.environ, {}, clear=True)
+@pytest.mark.usefixtures("no_openai_env")
 def test_validate_ai_settings_openai_without_key():
     """Test explicit OpenAI AI backend requires an API key."""
     with pytest.raises(ValueError, match="OpenAI API key is required"):
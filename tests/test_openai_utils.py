@@ -0,0 +1,160 @@
+"""Tests for the OpenAI translation helpers."""
+
+import json
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from openai import APIConnectionError
+
+from wwdcdigest._translate import translate_digest_content
+from wwdcdigest.models import OpenAIConfig, WWDCFrameSegment
+from wwdcdigest.openai_utils import (
+    TRANSLATION_MODEL,
+    OpenAIError,
+    OpenAIResponseError,
+    _parse_translations,
+    translate_texts,
+)
+
+
+def _completion(content: str | None) -> SimpleNamespace:
+    """Build a chat completion carrying the given message content."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+def _batch_texts(create: AsyncMock) -> list[str]:
+    """Extract the texts sent in the prompt of the last batch request."""
+    prompt = create.call_args.kwargs["messages"][-1]["content"]
+    return json.loads(prompt[prompt.index("\n\n") + 2 :])
+
+
+def test_translation_model() -> None:
+    """Test that translations keep using the model of earlier versions."""
+    assert TRANSLATION_MODEL == "gpt-4.1"
+
+
+def test_parse_translations() -> None:
+    """Test parsing a well-formed batch response."""
+    content = json.dumps({"translations": ["一", "二"]})
+    assert _parse_translations(content, 2) == ["一", "二"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        json.dumps({"translations": ["一"]}),
+        json.dumps({"translations": ["一", "二", "三"]}),
+        json.dumps({"result": ["一", "二"]}),
+        json.dumps({"translations": "一 二"}),
+    ],
+)
+def test_parse_translations_rejects_unexpected_count(content: str) -> None:
+    """Test that a response without one translation per text is rejected."""
+    with pytest.raises(OpenAIResponseError, match="unexpected number"):
+        _parse_translations(content, 2)
+
+
+@pytest.mark.parametrize(
+    "content", ['{"translations": ["一", "二"]', '["一", "二"]', "null"]
+)
+def test_parse_translations_rejects_malformed_json(content: str) -> None:
+    """Test that invalid JSON or JSON that is not an object is rejected."""
+    with pytest.raises(OpenAIResponseError, match="malformed"):
+        _parse_translations(content, 2)
+
+
+@pytest.mark.parametrize("content", [None, ""])
+def test_parse_translations_rejects_empty_content(content: str | None) -> None:
+    """Test that an empty response is rejected."""
+    with pytest.raises(OpenAIResponseError, match="No translation"):
+        _parse_translations(content, 2)
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_maps_translations_to_inputs(
+    openai_config: OpenAIConfig,
+) -> None:
+    """Test that translations are mapped back onto the texts that were sent."""
+    texts = ["First text", "これは日本語です", "Second text"]
+    create = AsyncMock(
+        return_value=_completion(json.dumps({"translations": ["最初", "二番目"]}))
+    )
+
+    with patch("wwdcdigest.openai_utils.AsyncOpenAI") as mock_client:
+        mock_client.return_value.chat.completions.create = create
+        translations = await translate_texts(texts, "ja", openai_config)
+
+    # Text already in the target language is kept and not sent
+    assert _batch_texts(create) == ["First text", "Second text"]
+    assert translations == ["最初", "これは日本語です", "二番目"]
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_rejects_missing_entries(
+    openai_config: OpenAIConfig,
+) -> None:
+    """Test that a response with too few translations is rejected."""
+    create = AsyncMock(return_value=_completion(json.dumps({"translations": ["一"]})))
+
+    with patch("wwdcdigest.openai_utils.AsyncOpenAI") as mock_client:
+        mock_client.return_value.chat.completions.create = create
+        with pytest.raises(OpenAIResponseError, match="unexpected number"):
+            await translate_texts(["First text", "Second text"], "ja", openai_config)
+
+
+@pytest.mark.asyncio
+async def test_translate_digest_content_falls_back_on_malformed_batch(
+    openai_config: OpenAIConfig,
+) -> None:
+    """Test that a malformed batch response is retried text by text."""
+    segments = [
+        WWDCFrameSegment(timestamp="00:00:01.000", text="Hello", image_path="1.jpg"),
+        WWDCFrameSegment(timestamp="00:00:02.000", text="Goodbye", image_path="2.jpg"),
+    ]
+    individual = {"Hello": "こんにちは", "Goodbye": "さようなら", "Summary": "要約"}
+
+    async def create(**kwargs: Any) -> SimpleNamespace:
+        if "response_format" in kwargs:
+            return _completion("not json")
+        prompt = kwargs["messages"][-1]["content"]
+        return _completion(individual[prompt.rsplit("\n\n", 1)[-1]])
+
+    with patch("wwdcdigest.openai_utils.AsyncOpenAI") as mock_client:
+        mock_client.return_value.chat.completions.create = AsyncMock(side_effect=create)
+        summary, _, translated_segments = await translate_digest_content(
+            "Summary", [], segments, "ja", openai_config
+        )
+
+    assert summary == "要約"
+    assert [segment.text for segment in translated_segments] == [
+        "こんにちは",
+        "さようなら",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_translate_digest_content_raises_connection_errors(
+    openai_config: OpenAIConfig,
+) -> None:
+    """Test that a connection failure is raised instead of retried per text."""
+    segments = [
+        WWDCFrameSegment(timestamp="00:00:01.000", text="Hello", image_path="1.jpg"),
+    ]
+    create = AsyncMock(
+        side_effect=APIConnectionError(
+            request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        )
+    )
+
+    with patch("wwdcdigest.openai_utils.AsyncOpenAI") as mock_client:
+        mock_client.return_value.chat.completions.create = create
+        with pytest.raises(OpenAIError) as exc_info:
+            await translate_digest_content("Summary", [], segments, "ja", openai_config)
+
+    assert not isinstance(exc_info.value, OpenAIResponseError)
+    create.assert_awaited_once()
@@ -8,7 +8,7 @@ from wwdcdigest.models import OpenAIConfig
 from wwdcdigest.summarizer import DefaultSummarizer, OpenAIContentSummarizer
 
 
-@pytest.mark.anyio
+@pytest.mark.asyncio
 async def test_default_summarizer():
     """Test the DefaultSummarizer."""
     summarizer = DefaultSummarizer()
@@ -23,11 +23,10 @@ async def test_default_summarizer():
     assert key_points == []
 
 
-@pytest.mark.anyio
-async def test_openai_summarizer():
+@pytest.mark.asyncio
+async def test_openai_summarizer(openai_config: OpenAIConfig):
     """Test the OpenAIContentSummarizer."""
-    config = OpenAIConfig(api_key="test-key")
-    summarizer = OpenAIContentSummarizer(config)
+    summarizer = OpenAIContentSummarizer(openai_config)
     transcript = "This is a test transcript"
     session_title = "Test Session"
 
@@ -46,7 +45,9 @@ async def test_openai_summarizer():
         )
 
         # Check that the mock was called with the right arguments
-        mock_generate.assert_called_once_with(transcript, session_title, config, "en")
+        mock_generate.assert_called_once_with(
+            transcript, session_title, openai_config, "en"
+        )
 
         # Check the results
         assert summary == "Test summary from OpenAI"
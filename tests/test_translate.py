@@ -4,17 +4,32 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from wwdcdigest._translate import translate_digest_content
+from wwdcdigest._translate import TRANSLATION_BATCH_SIZE, translate_digest_content
 from wwdcdigest.models import OpenAIConfig, WWDCFrameSegment
+from wwdcdigest.openai_utils import OpenAIError, OpenAIResponseError
 
+TRANSLATIONS = {
+    "This is a test summary": "これはテストの要約です",
+    "Point 1": "ポイント 1",
+    "Point 2": "ポイント 2",
+    "Point 3": "ポイント 3",
+    "This is the first segment": "これは最初のセグメントです",
+    "This is the second segment": "これは2番目のセグメントです",
+}
 
-@pytest.mark.anyio
-async def test_translate_digest_content():
-    """Test translating digest content to a target language."""
-    # Prepare test data
-    summary = "This is a test summary"
-    key_points = ["Point 1", "Point 2", "Point 3"]
-    segments = [
+
+def _fake_translate_texts(calls: list[list[str]]):
+    """Create a translate_texts stub that records the texts of each call."""
+
+    async def translate_texts(texts, lang, cfg):  # noqa: ARG001
+        calls.append(texts)
+        return [TRANSLATIONS.get(text, f"Translated: {text}") for text in texts]
+
+    return translate_texts
+
+
+def _make_segments() -> list[WWDCFrameSegment]:
+    return [
         WWDCFrameSegment(
             timestamp="00:01:23.456",
             text="This is the first segment",
@@ -26,38 +41,32 @@ async def test_translate_digest_content():
             image_path="/path/to/image2.jpg",
         ),
     ]
+
+
+@pytest.mark.asyncio
+async def test_translate_digest_content(openai_config: OpenAIConfig):
+    """Test translating digest content to a target language."""
+    # Prepare test data
+    summary = "This is a test summary"
+    key_points = ["Point 1", "Point 2", "Point 3"]
+    segments = _make_segments()
     language = "ja"
-    config = OpenAIConfig(api_key="test-key")
-
-    # Mock translate_text to return translated versions
-    with patch(
-        "wwdcdigest._translate.translate_text", new_callable=AsyncMock
-    ) as mock_translate:
-        # Set up return values for different inputs
-        async def translate_side_effect(text, lang, cfg):  # noqa: ARG001
-            translations = {
-                "This is a test summary": "これはテストの要約です",
-                "Point 1": "ポイント 1",
-                "Point 2": "ポイント 2",
-                "Point 3": "ポイント 3",
-                "This is the first segment": "これは最初のセグメントです",
-                "This is the second segment": "これは2番目のセグメントです",
-            }
-            return translations.get(text, f"Translated: {text}")
-
-        mock_translate.side_effect = translate_side_effect
 
+    # Mock translate_texts to return translated versions
+    calls: list[list[str]] = []
+    with patch("wwdcdigest._translate.translate_texts", _fake_translate_texts(calls)):
         # Call the function
         (
             translated_summary,
             translated_key_points,
             translated_segments,
         ) = await translate_digest_content(
-            summary, key_points, segments, language, config
+            summary, key_points, segments, language, openai_config
         )
 
-        # Check that translation was called for each item
-        assert mock_translate.call_count == 1 + len(key_points) + len(segments)
+        # Check that all texts were sent in a single batch
+        assert len(calls) == 1
+        assert len(calls[0]) == 1 + len(key_points) + len(segments)
 
         # Check the results
         assert translated_summary == "これはテストの要約です"
@@ -69,3 +78,133 @@ async def test_translate_digest_content():
         assert segments is translated_segments
         assert segments[0].text == "これは最初のセグメントです"
         assert segments[1].text == "これは2番目のセグメントです"
+
+
+@pytest.mark.asyncio
+async def test_translate_digest_content_falls_back_to_individual_requests(
+    openai_config: OpenAIConfig,
+):
+    """Test that a failed batch translation falls back to per-text requests."""
+    key_points = ["Point 1", "Point 2", "Point 3"]
+    segments = _make_segments()
+
+    failed_batches: list[list[str]] = []
+    translated_texts: list[str] = []
+
+    async def translate_texts(texts, lang, cfg):  # noqa: ARG001
+        failed_batches.append(texts)
+        raise OpenAIResponseError("length mismatch")
+
+    async def translate_text(text, lang, cfg):  # noqa: ARG001
+        translated_texts.append(text)
+        return TRANSLATIONS.get(text, f"Translated: {text}")
+
+    with (
+        patch("wwdcdigest._translate.translate_texts", translate_texts),
+        patch("wwdcdigest._translate.translate_text", translate_text),
+    ):
+        (
+            translated_summary,
+            translated_key_points,
+            translated_segments,
+        ) = await translate_digest_content(
+            "This is a test summary", key_points, segments, "ja", openai_config
+        )
+
+        # Check that translation was called for each item
+        assert len(failed_batches) == 1
+        assert len(translated_texts) == 1 + len(key_points) + len(segments)
+        assert translated_summary == "これはテストの要約です"
+        assert translated_key_points == ["ポイント 1", "ポイント 2", "ポイント 3"]
+        assert translated_segments[1].text == "これは2番目のセグメントです"
+
+
+@pytest.mark.asyncio
+async def test_translate_digest_content_raises_api_errors(
+    openai_config: OpenAIConfig,
+):
+    """Test that API errors such as rate limits do not fall back per text."""
+    translate_text = AsyncMock()
+
+    async def translate_texts(texts, lang, cfg):  # noqa: ARG001
+        raise OpenAIError("OpenAI API rate limit exceeded")
+
+    with (
+        patch("wwdcdigest._translate.translate_texts", translate_texts),
+        patch("wwdcdigest._translate.translate_text", translate_text),
+        pytest.raises(OpenAIError, match="rate limit"),
+    ):
+        await translate_digest_content(
+            "This is a test summary", [], _make_segments(), "ja", openai_config
+        )
+
+    translate_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_translate_digest_content_deduplicates_texts(openai_config: OpenAIConfig):
+    """Test that identical texts are only sent for translation once."""
+    segments = _make_segments()
+    segments[1].text = segments[0].text
+
+    calls: list[list[str]] = []
+    with patch("wwdcdigest._translate.translate_texts", _fake_translate_texts(calls)):
+        _, translated_key_points, translated_segments = await translate_digest_content(
+            "This is a test summary",
+            ["Point 1", "Point 1"],
+            segments,
+            "ja",
+            openai_config,
+        )
+
+        assert calls == [
+            [
+                "This is a test summary",
+                "Point 1",
+                "This is the first segment",
+            ]
+        ]
+        assert translated_key_points == ["ポイント 1", "ポイント 1"]
+        assert [segment.text for segment in translated_segments] == [
+            "これは最初のセグメントです",
+            "これは最初のセグメントです",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_translate_digest_content_splits_large_inputs_into_batches(
+    openai_config: OpenAIConfig,
+):
+    """Test that many texts are split into bounded batches in order."""
+    segments = [
+        WWDCFrameSegment(
+            timestamp="00:00:00.000", text=f"Segment {i}", image_path=f"{i}.jpg"
+        )
+        for i in range(2 * TRANSLATION_BATCH_SIZE)
+    ]
+
+    calls: list[list[str]] = []
+    with patch("wwdcdigest._translate.translate_texts", _fake_translate_texts(calls)):
+        await translate_digest_content("Summary", [], segments, "ja", openai_config)
+
+        assert len(calls) == 3
+        assert all(len(texts) <= TRANSLATION_BATCH_SIZE for texts in calls)
+        assert [segment.text for segment in segments] == [
+            f"Translated: Segment {i}" for i in range(2 * TRANSLATION_BATCH_SIZE)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_translate_digest_content_skips_blank_texts(openai_config: OpenAIConfig):
+    """Test that blank texts are not sent for translation."""
+    segments = _make_segments()
+
+    calls: list[list[str]] = []
+    with patch("wwdcdigest._translate.translate_texts", _fake_translate_texts(calls)):
+        translated_summary, _, _ = await translate_digest_content(
+            "", [], segments, "ja", openai_config
+        )
+
+        assert all("" not in texts for texts in calls)
+        assert translated_summary == ""
+        assert segments[0].text == "これは最初のセグメントです"
@@ -0,0 +1,156 @@
+"""Tests for the persistent translation cache."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from wwdcdigest._translate_cache import TranslationCache, get_translation_cache
+from wwdcdigest.models import OpenAIConfig
+from wwdcdigest.openai_utils import TRANSLATION_MODEL, translate_text, translate_texts
+
+
+def _completion(content: str) -> SimpleNamespace:
+    """Build a chat completion carrying the given message content."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+def _shared_cache() -> TranslationCache:
+    """Return the shared cache, which the tests expect to be available."""
+    cache = get_translation_cache()
+    assert cache is not None
+    return cache
+
+
+def test_translation_cache_round_trip(tmp_path: Path) -> None:
+    """Test storing and retrieving a translation."""
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+
+    assert cache.get("Hello", "ja", "gpt-4.1") is None
+
+    cache.set("Hello", "ja", "gpt-4.1", "こんにちは")
+
+    assert cache.get("Hello", "ja", "gpt-4.1") == "こんにちは"
+    cache.close()
+
+
+def test_translation_cache_is_keyed_by_language_and_model(tmp_path: Path) -> None:
+    """Test that translations for other languages or models are not returned."""
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("Hello", "ja", "gpt-4.1", "こんにちは")
+
+    assert cache.get("Hello", "fr", "gpt-4.1") is None
+    assert cache.get("Hello", "ja", "other-model") is None
+    cache.close()
+
+
+def test_translation_cache_persists_across_connections(tmp_path: Path) -> None:
+    """Test that cached translations survive reopening the database."""
+    path = str(tmp_path / "cache.sqlite3")
+    cache = TranslationCache(path)
+    cache.set("Hello", "ja", "gpt-4.1", "こんにちは")
+    cache.close()
+
+    reopened = TranslationCache(path)
+    assert reopened.get("Hello", "ja", "gpt-4.1") == "こんにちは"
+    reopened.close()
+
+
+def test_translation_cache_is_keyed_by_endpoint(tmp_path: Path) -> None:
+    """Test that translations from another API endpoint are not returned."""
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("Hello", "ja", "gpt-4.1", "こんにちは", "https://example.com/v1")
+
+    assert cache.get("Hello", "ja", "gpt-4.1") is None
+    assert cache.get("Hello", "ja", "gpt-4.1", "https://other.example.com/v1") is None
+    assert cache.get("Hello", "ja", "gpt-4.1", "https://example.com/v1") == "こんにちは"
+    cache.close()
+
+
+def test_translation_cache_get_many_and_set_many(tmp_path: Path) -> None:
+    """Test looking up and storing several translations at once."""
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    cache.set_many({"Hello": "こんにちは", "Goodbye": "さようなら"}, "ja", "gpt-4.1")
+
+    assert cache.get_many(["Goodbye", "Thanks", "Hello"], "ja", "gpt-4.1") == [
+        "さようなら",
+        None,
+        "こんにちは",
+    ]
+    cache.close()
+
+
+def test_shared_cache_uses_cache_dir(isolated_translation_cache: Path) -> None:
+    """Test that the shared cache is created under WWDCDIGEST_CACHE_DIR."""
+    cache = _shared_cache()
+
+    assert Path(cache.path).parent == isolated_translation_cache
+    assert get_translation_cache() is cache
+
+
+@pytest.mark.asyncio
+async def test_translate_text_uses_cached_translation(
+    openai_config: OpenAIConfig,
+) -> None:
+    """Test that a cached translation is returned without calling the API."""
+    _shared_cache().set("Hello world", "ja", TRANSLATION_MODEL, "こんにちは世界")
+
+    with patch("wwdcdigest.openai_utils.AsyncOpenAI") as mock_client:
+        translation = await translate_text("Hello world", "ja", openai_config)
+
+    assert translation == "こんにちは世界"
+    mock_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_translate_text_stores_translation_on_miss(
+    openai_config: OpenAIConfig,
+) -> None:
+    """Test that a translation fetched from the API is stored in the cache."""
+    create = AsyncMock(return_value=_completion("こんにちは世界"))
+
+    with patch("wwdcdigest.openai_utils.AsyncOpenAI") as mock_client:
+        mock_client.return_value.chat.completions.create = create
+        translation = await translate_text("Hello world", "ja", openai_config)
+
+    assert translation == "こんにちは世界"
+    create.assert_awaited_once()
+    assert (
+        _shared_cache().get("Hello world", "ja", TRANSLATION_MODEL) == "こんにちは世界"
+    )
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_uses_and_fills_cache(
+    openai_config: OpenAIConfig,
+) -> None:
+    """Test that only uncached texts are sent and their results are stored."""
+    cache = _shared_cache()
+    cache.set("Hello world", "ja", TRANSLATION_MODEL, "こんにちは世界")
+    create = AsyncMock(
+        return_value=_completion(json.dumps({"translations": ["さようなら世界"]}))
+    )
+
+    with patch("wwdcdigest.openai_utils.AsyncOpenAI") as mock_client:
+        mock_client.return_value.chat.completions.create = create
+        translations = await translate_texts(
+            ["Hello world", "Goodbye world"], "ja", openai_config
+        )
+
+    assert translations == ["こんにちは世界", "さようなら世界"]
+    prompt = create.call_args.kwargs["messages"][-1]["content"]
+    assert "Hello world" not in prompt
+    assert cache.get("Goodbye world", "ja", TRANSLATION_MODEL) == "さようなら世界"
+
+    # A second run is served entirely from the cache
+    with patch("wwdcdigest.openai_utils.AsyncOpenAI") as mock_client:
+        translations = await translate_texts(
+            ["Hello world", "Goodbye world"], "ja", openai_config
+        )
+
+    assert translations == ["こんにちは世界", "さようなら世界"]
+    mock_client.assert_not_called()
@@ -4,15 +4,14 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from wwdcdigest.models import OpenAIConfig, WWDCFrameSegment
-from wwdcdigest.translator import OpenAIContentTranslator
+from wwdcdigest.models import AIConfig, OpenAIConfig, WWDCFrameSegment
+from wwdcdigest.translator import ExternalAIContentTranslator, OpenAIContentTranslator
 
 
-@pytest.mark.anyio
-async def test_openai_translator():
+@pytest.mark.asyncio
+async def test_openai_translator(openai_config: OpenAIConfig):
     """Test the OpenAIContentTranslator."""
-    config = OpenAIConfig(api_key="test-key")
-    translator = OpenAIContentTranslator(config)
+    translator = OpenAIContentTranslator(openai_config)
 
     # Test data
     summary = "This is a test summary"
@@ -31,23 +30,21 @@ async def test_openai_translator():
     ]
     target_language = "ja"
 
-    # Mock the translate_text function
-    with patch(
-        "wwdcdigest.translator.translate_text", new_callable=AsyncMock
-    ) as mock_translate:
-        # Set up return values for different inputs
-        async def translate_side_effect(text, lang, cfg):  # noqa: ARG001
-            translations = {
-                "This is a test summary": "これはテストの要約です",
-                "Point 1": "ポイント 1",
-                "Point 2": "ポイント 2",
-                "This is segment 1": "これはセグメント1です",
-                "This is segment 2": "これはセグメント2です",
-            }
-            return translations.get(text, f"Translated: {text}")
-
-        mock_translate.side_effect = translate_side_effect
+    # Stub the batch translation function
+    translations = {
+        "This is a test summary": "これはテストの要約です",
+        "Point 1": "ポイント 1",
+        "Point 2": "ポイント 2",
+        "This is segment 1": "これはセグメント1です",
+        "This is segment 2": "これはセグメント2です",
+    }
+    calls: list[list[str]] = []
+
+    async def translate_texts(texts, lang, cfg):  # noqa: ARG001
+        calls.append(texts)
+        return [translations.get(text, f"Translated: {text}") for text in texts]
 
+    with patch("wwdcdigest._translate.translate_texts", translate_texts):
         # Call the translate method
         (
             translated_summary,
@@ -55,8 +52,8 @@ async def test_openai_translator():
             translated_segments,
         ) = await translator.translate(summary, key_points, segments, target_language)
 
-        # Check the number of calls
-        assert mock_translate.call_count == 1 + len(key_points) + len(segments)
+        # Check that all texts were translated in a single batch request
+        assert len(calls) == 1
 
         # Check the results
         assert translated_summary == "これはテストの要約です"
@@ -68,3 +65,30 @@ async def test_openai_translator():
         assert segments is translated_segments
         assert segments[0].text == "これはセグメント1です"
         assert segments[1].text == "これはセグメント2です"
+
+
+@pytest.mark.asyncio
+async def test_external_translator_deduplicates_texts():
+    """Test that the external translator translates repeated texts once."""
+    config = AIConfig(provider="claude")
+    translator = ExternalAIContentTranslator(config)
+    segments = [
+        WWDCFrameSegment(timestamp="00:00:01.000", text="Okay.", image_path="1.jpg"),
+        WWDCFrameSegment(timestamp="00:00:02.000", text="Hello", image_path="2.jpg"),
+        WWDCFrameSegment(timestamp="00:00:03.000", text="Okay.", image_path="3.jpg"),
+    ]
+
+    with patch(
+        "wwdcdigest.translator.complete_text_with_cli", new_callable=AsyncMock
+    ) as mock_complete:
+        mock_complete.side_effect = lambda prompt, cfg: (  # noqa: ARG005
+            "T:" + prompt.rsplit("\n\n", 1)[-1]
+        )
+        summary, key_points, _ = await translator.translate(
+            "Hello", ["Okay."], segments, "ja"
+        )
+
+    assert mock_complete.call_count == 2
+    assert summary == "T:Hello"
+    assert key_points == ["T:Okay."]
+    assert [segment.text for segment in segments] == ["T:Okay.", "T:Hello", "T:Okay."]
@@ -1,25 +1,75 @@
 """Tests for video processing utilities."""
 
 import os
-import tempfile
+import pickle
+import shutil
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain, repeat
 from pathlib import Path
 from typing import Literal
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import cv2
 import numpy as np
 import pytest
 
+from wwdcdigest import video
+from wwdcdigest.cli.digest import digest_command
 from wwdcdigest.models import ImageOptions
 from wwdcdigest.video import (
+    AVIF_SAVE_OPTIONS,
+    COMPARE_WIDTH,
     SIMILARITY_THRESHOLD,
+    _comparison_thumbnail,
+    _cv2_avif_params,
+    _grab_target_frames,
+    _resize_frame,
+    _save_frame_image,
     compare_images,
-    delete_unused_image_files,
     extract_frames_from_video,
+    get_encode_executor,
+    load_segments_from_frames_dir,
 )
 from wwdcdigest.webvtt_utils import parse_webvtt_time, prepare_subtitle_path
 
 
+@pytest.mark.parametrize("missing_flag", ["IMWRITE_AVIF_QUALITY", "IMWRITE_AVIF_SPEED"])
+def test_cv2_avif_params_without_avif_flags(
+    monkeypatch: pytest.MonkeyPatch, missing_flag: str
+):
+    """Test that OpenCV releases without the AVIF flags fall back to PIL."""
+    monkeypatch.setattr(cv2, "haveImageWriter", lambda ext: True, raising=False)  # noqa: ARG005
+    monkeypatch.setattr(cv2, "IMWRITE_AVIF_QUALITY", 512, raising=False)
+    monkeypatch.setattr(cv2, "IMWRITE_AVIF_SPEED", 513, raising=False)
+    monkeypatch.delattr(cv2, missing_flag)
+
+    assert _cv2_avif_params() is None
+
+
+def test_cv2_avif_params_with_avif_writer(monkeypatch: pytest.MonkeyPatch):
+    """Test the AVIF parameters of OpenCV builds that can encode AVIF."""
+    monkeypatch.setattr(cv2, "haveImageWriter", lambda ext: ext == ".avif")
+    monkeypatch.setattr(cv2, "IMWRITE_AVIF_QUALITY", 512, raising=False)
+    monkeypatch.setattr(cv2, "IMWRITE_AVIF_SPEED", 513, raising=False)
+
+    assert _cv2_avif_params() == [512, 50, 513, 6]
+    monkeypatch.setattr(cv2, "haveImageWriter", lambda ext: False)  # noqa: ARG005
+    assert _cv2_avif_params() is None
+
+
+def test_default_image_options():
+    """Test that frames default to AVIF at quality 50 in the API and the CLI."""
+    assert ImageOptions().format == "avif"
+    assert AVIF_SAVE_OPTIONS == {"quality": 50, "speed": 6}
+
+    image_format = next(
+        param for param in digest_command.params if param.name == "image_format"
+    )
+    assert image_format.default == "avif"
+
+
 def test_parse_webvtt_time():
     """Test parsing WebVTT timestamps."""
     # Test hours, minutes, seconds format
@@ -30,343 +80,523 @@ def test_parse_webvtt_time():
     assert parse_webvtt_time("12.345") == 12.345
 
 
-@pytest.mark.anyio
-async def test_compare_images():
+def test_compare_images(tmp_path: Path, black_jpg_path: str, white_jpg_path: str):
     """Test image comparison."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create two test images (black squares)
-        # Create identical images
-        img1 = np.zeros((100, 100, 3), dtype=np.uint8)
-        img2 = np.zeros((100, 100, 3), dtype=np.uint8)
-
-        # Save images
-        img1_path = os.path.join(temp_dir, "img1.jpg")
-        img2_path = os.path.join(temp_dir, "img2.jpg")
-        cv2.imwrite(img1_path, img1)
-        cv2.imwrite(img2_path, img2)
-
-        # Compare identical images
-        similarity = compare_images(img1_path, img2_path)
-        assert similarity >= SIMILARITY_THRESHOLD
-
-        # Create a different image (white square)
-        img3 = np.ones((100, 100, 3), dtype=np.uint8) * 255
-        img3_path = os.path.join(temp_dir, "img3.jpg")
-        cv2.imwrite(img3_path, img3)
-
-        # Compare different images
-        similarity = compare_images(img1_path, img3_path)
-        assert similarity < SIMILARITY_THRESHOLD
-
-
-@pytest.mark.anyio
-async def test_extract_frames_merges_similar_frames():
-    """Test that similar consecutive frames are merged."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a real temporary subtitle file
-        subtitle_path = os.path.join(temp_dir, "subtitle.vtt")
-        with open(subtitle_path, "w", encoding="utf-8") as f:
-            f.write("WEBVTT\n\n")
-
-        video_path = "video.mp4"  # This will be mocked
-        output_dir = temp_dir
-
-        # Create a mock for cv2.VideoCapture
-        mock_video = MagicMock()
-        mock_video.isOpened.return_value = True
-
-        # Define a side effect function with explicit typing
-        def get_mock(prop: int) -> float:
-            return 30.0 if prop == cv2.CAP_PROP_FPS else 300.0
-
-        mock_video.get.side_effect = get_mock
-
-        # Create similar mock frames (black images)
-        frame1 = np.zeros((100, 100, 3), dtype=np.uint8)
-        frame2 = np.zeros((100, 100, 3), dtype=np.uint8)
-
-        # Create a different frame (white image)
-        frame3 = np.ones((100, 100, 3), dtype=np.uint8) * 255
-
-        # Set up read to return our frames
-        mock_video.read.side_effect = [
-            (True, frame1),
-            (True, frame2),  # Similar to frame1, should be merged
-            (True, frame3),  # Different, should be a new segment
-            (False, None),  # End of video
-        ]
-
-        # Mock WebVTT data
-        mock_captions = [
-            MagicMock(start="00:00:10.000", text="Caption 1"),
-            MagicMock(
-                start="00:00:15.000", text="Caption 2"
-            ),  # Should be merged with Caption 1
-            MagicMock(
-                start="00:00:20.000", text="Caption 3"
-            ),  # Different frame, should be separate
-        ]
-        mock_vtt = MagicMock()
-        mock_vtt.__iter__.return_value = mock_captions
-
-        # Create a mock for _save_frame_image that does nothing
-        def mock_save_frame(
-            frame: np.ndarray, path: str, image_options: "ImageOptions"
-        ) -> None:
-            pass
-
-        # Patch dependencies
-        with (
-            patch("wwdcdigest.video.cv2.VideoCapture", return_value=mock_video),
-            patch("wwdctools.combine_webvtt_files", return_value=None),
-            patch("wwdcdigest.video.webvtt.read", return_value=mock_vtt),
-            patch("wwdcdigest.video.compare_images") as mock_compare,
-            patch("wwdcdigest.video._save_frame_image", side_effect=mock_save_frame),
-            # Add a patch for vtt.captions to ensure it's properly accessible
-            patch.object(mock_vtt, "captions", mock_captions),
-        ):
-            # Set up compare_images to return high similarity for the first two frames
-            # and low similarity for the third
-            mock_compare.side_effect = [0.98, 0.3]
-
-            # Call the function with ImageOptions
-            from wwdcdigest.models import ImageOptions
-
-            image_options = ImageOptions(format="jpg")
-            segments = extract_frames_from_video(
-                video_path, subtitle_path, output_dir, image_options
-            )
-
-            # Check that we got 2 segments (3 frames with 2 similar ones merged)
-            assert len(segments) == 2
-
-            # Check that the first segment has merged text
-            assert "Caption 1" in segments[0].text
-            assert "Caption 2" in segments[0].text
-
-            # Check that the third caption is in the second segment
-            assert segments[1].text == "Caption 3"
-
-
-@pytest.mark.anyio
-async def testprepare_subtitle_path():
-    """Test preparing subtitle path with multiple files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a mock subtitle directory with multiple .webvtt files
-        subtitle_dir = Path(temp_dir) / "subtitles"
-        subtitle_dir.mkdir()
-
-        # Create multiple subtitle files
-        (subtitle_dir / "part1.webvtt").write_text(
-            "WEBVTT\n\n1\n00:00:10.000 --> 00:00:15.000\nPart 1"
-        )
-        (subtitle_dir / "part2.webvtt").write_text(
-            "WEBVTT\n\n2\n00:00:20.000 --> 00:00:25.000\nPart 2"
-        )
+    # Compare identical images
+    copy_path = shutil.copy(black_jpg_path, tmp_path / "copy.jpg")
+    similarity = compare_images(black_jpg_path, str(copy_path))
+    assert similarity >= SIMILARITY_THRESHOLD
 
-        # Test combining subtitles
-        output_dir = Path(temp_dir) / "output"
-        output_dir.mkdir()
+    # Compare different images (black and white squares)
+    similarity = compare_images(black_jpg_path, white_jpg_path)
+    assert similarity < SIMILARITY_THRESHOLD
 
-        combined_path = prepare_subtitle_path(str(subtitle_dir), str(output_dir))
 
-        # Check that the combined file exists and contains both parts
-        assert os.path.exists(combined_path)
-        with open(combined_path, encoding="utf-8") as f:
-            content = f.read()
-            assert "Part 1" in content
-            assert "Part 2" in content
+def test_compare_images_accepts_arrays():
+    """Test comparing in-memory grayscale and BGR images."""
+    black = np.zeros((90, 160), dtype=np.uint8)
+    white_bgr = np.full((180, 320, 3), 255, dtype=np.uint8)
+
+    assert compare_images(black, black.copy()) >= SIMILARITY_THRESHOLD
+    assert compare_images(black, white_bgr) < SIMILARITY_THRESHOLD
+
+
+def test_compare_images_detects_rearranged_layout():
+    """Test that frames with the same brightness but different layout differ."""
+    left_dark = np.zeros((90, 160), dtype=np.uint8)
+    left_dark[:, 80:] = 255
+    right_dark = np.fliplr(left_dark).copy()
+
+    assert compare_images(left_dark, right_dark) < SIMILARITY_THRESHOLD
+
+
+def test_compare_images_unreadable_image():
+    """Test that an unreadable image is never similar to another image."""
+    black = np.zeros((90, 160), dtype=np.uint8)
+    assert compare_images(black, "missing.png") == 0.0
+
+
+def test_comparison_thumbnail_downscales_to_grayscale():
+    """Test that comparison thumbnails are small grayscale images."""
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    thumbnail = _comparison_thumbnail(frame)
+    assert thumbnail.shape == (180, COMPARE_WIDTH)
+
+
+def test_resize_frame():
+    """Test resizing frames to a width while keeping the aspect ratio."""
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    assert _resize_frame(frame, 1280).shape == (720, 1280, 3)
+    assert _resize_frame(frame, None) is frame
+    assert _resize_frame(frame, 1920) is frame
+
+
+@pytest.mark.parametrize("cv2_avif_params", [[512, 50, 513, 6], None])
+def test_save_frame_image_avif(tmp_path: Path, cv2_avif_params: list[int] | None):
+    """Test that AVIF frames are encoded by OpenCV when it supports AVIF."""
+    frame = np.zeros((90, 160, 3), dtype=np.uint8)
+    image_path = str(tmp_path / "frame.avif")
+
+    with (
+        patch("wwdcdigest.video.CV2_AVIF_PARAMS", cv2_avif_params),
+        patch("wwdcdigest.video.cv2.imwrite") as mock_imwrite,
+        patch("wwdcdigest.video.Image.Image.save") as mock_pil_save,
+    ):
+        _save_frame_image(frame, image_path, ImageOptions(format="avif"))
+
+    if cv2_avif_params:
+        mock_imwrite.assert_called_once_with(image_path, frame, cv2_avif_params)
+        mock_pil_save.assert_not_called()
+    else:
+        mock_imwrite.assert_not_called()
+        mock_pil_save.assert_called_once()
+
+
+def _build_video_mocks(
+    frames: list[np.ndarray], captions: list[tuple[str, str]], fps: float = 30.0
+) -> tuple[MagicMock, MagicMock]:
+    """Build VideoCapture and WebVTT mocks for frame extraction tests.
+
+    Args:
+        frames: Frames returned by successive retrieve calls, repeating the
+            last one when exhausted
+        captions: (start, text) pairs of the WebVTT captions
+        fps: Frame rate reported by the capture
+
+    Returns:
+        Tuple of the VideoCapture mock and the WebVTT mock
+    """
+    mock_video = MagicMock(spec=cv2.VideoCapture)
+    mock_video.isOpened.return_value = True
+    mock_video.get.return_value = fps
+    mock_video.grab.return_value = True
+    mock_video.set.return_value = True
+    retrieved = [(True, frame) for frame in frames]
+    mock_video.retrieve.side_effect = chain(retrieved, repeat(retrieved[-1]))
+
+    mock_captions = [MagicMock(start=start, text=text) for start, text in captions]
+    mock_vtt = MagicMock(captions=mock_captions)
+    return mock_video, mock_vtt
+
+
+@contextmanager
+def _patch_extraction(
+    mock_video: MagicMock, mock_vtt: MagicMock, similarity: MagicMock
+) -> Iterator[MagicMock]:
+    """Patch decoding, subtitle parsing and encoding for frame extraction.
+
+    Args:
+        mock_video: Mock returned in place of cv2.VideoCapture
+        mock_vtt: Mock returned in place of the parsed WebVTT file
+        similarity: Mock used in place of _signature_similarity
+
+    Yields:
+        The mock used in place of _save_frame_image
+    """
+    with (
+        patch("wwdcdigest.video.cv2.VideoCapture", return_value=mock_video),
+        patch.multiple(
+            "wwdcdigest.video",
+            webvtt=DEFAULT,
+            _signature_similarity=similarity,
+            _save_frame_image=DEFAULT,
+        ) as mocks,
+    ):
+        mocks["webvtt"].read.return_value = mock_vtt
+        yield mocks["_save_frame_image"]
+
+
+@pytest.fixture(scope="session")
+def empty_vtt_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty WebVTT subtitle file written once for the whole session."""
+    path = tmp_path_factory.mktemp("subtitles") / "empty.vtt"
+    path.write_bytes(b"WEBVTT\n\n")
+    return path
+
+
+@pytest.fixture
+def subtitle_path(tmp_path: Path, empty_vtt_path: Path) -> str:
+    """Link the empty WebVTT subtitle file into the test's directory."""
+    path = tmp_path / "subtitle.vtt"
+    try:
+        os.link(empty_vtt_path, path)
+    except OSError:
+        # Hard links can fail across file systems or on Windows
+        shutil.copy(empty_vtt_path, path)
+    return str(path)
+
+
+def test_extract_frames_merges_similar_frames(
+    tmp_path: Path,
+    subtitle_path: str,
+    black_frame: np.ndarray,
+    white_frame: np.ndarray,
+):
+    """Test that similar consecutive frames are merged."""
+    mock_video, mock_vtt = _build_video_mocks(
+        [
+            black_frame,
+            black_frame,  # Similar to the first frame, should be merged
+            white_frame,  # Different, should be a new segment
+        ],
+        [
+            ("00:00:10.000", "Caption 1"),
+            ("00:00:15.000", "Caption 2"),  # Should be merged with Caption 1
+            ("00:00:20.000", "Caption 3"),  # Different frame, should be separate
+        ],
+    )
+
+    # Return high similarity for the first two frames and low similarity
+    # for the third
+    similarity = MagicMock(side_effect=[0.98, 0.3])
+
+    with _patch_extraction(mock_video, mock_vtt, similarity) as mock_save:
+        segments = extract_frames_from_video(
+            "video.mp4", subtitle_path, str(tmp_path), ImageOptions(format="jpg")
+        )
 
+    # Check that we got 2 segments (3 frames with 2 similar ones merged)
+    assert len(segments) == 2
+
+    # Check that the first segment has merged text
+    assert "Caption 1" in segments[0].text
+    assert "Caption 2" in segments[0].text
+
+    # Check that the third caption is in the second segment
+    assert segments[1].text == "Caption 3"
+
+    # Only the frames that end up in segments are encoded
+    saved_paths = [call.args[1] for call in mock_save.call_args_list]
+    assert saved_paths == [segment.image_path for segment in segments]
+
+
+def test_extract_frames_decodes_video_once(
+    tmp_path: Path, subtitle_path: str, black_frame: np.ndarray
+):
+    """Test that the video is read in one forward pass without seeking."""
+    # Two captions start on the same frame, and one is out of order
+    mock_video, mock_vtt = _build_video_mocks(
+        [black_frame],
+        [
+            ("00:00:02.000", "Caption 1"),
+            ("00:00:01.000", "Caption 2"),
+            ("00:00:02.000", "Caption 3"),
+        ],
+        fps=10.0,
+    )
+
+    with _patch_extraction(mock_video, mock_vtt, MagicMock(return_value=0.5)):
+        segments = extract_frames_from_video(
+            "video.mp4", subtitle_path, str(tmp_path), ImageOptions(format="jpg")
+        )
 
-@pytest.mark.anyio
-async def testprepare_subtitle_path_deduplicates_captions():
-    """Test that duplicate captions are removed when combining subtitle files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a mock subtitle directory with multiple .webvtt files
-        subtitle_dir = Path(temp_dir) / "subtitles"
-        subtitle_dir.mkdir()
-
-        # Create subtitle files with duplicate content
-        (subtitle_dir / "sequence_1.webvtt").write_text(
-            "WEBVTT\n\n"
-            "00:00:06.904 --> 00:00:10.374 align:center line:79%\n"
-            "Hello, I'm Nicholas,\n"
-            "an engineer on the Accessibility team.\n\n"
-            "00:00:11.074 --> 00:00:13.277 align:center line:79%\n"
-            "Accessibility empowers everyone\n"
-            "to experience\n\n"
+    # Frames 0-20 are grabbed once each, pixels are retrieved per distinct
+    # target frame, and the capture is never repositioned
+    assert mock_video.grab.call_count == 21
+    assert mock_video.retrieve.call_count == 2
+    mock_video.set.assert_not_called()
+    assert [segment.text for segment in segments] == [
+        "Caption 2",
+        "Caption 1",
+        "Caption 3",
+    ]
+
+
+def test_extract_frames_seeks_over_long_gaps(
+    tmp_path: Path, subtitle_path: str, black_frame: np.ndarray
+):
+    """Test that long gaps between captions are skipped with a seek."""
+    # Captions 60 seconds apart are 600 frames apart at 10 fps
+    mock_video, mock_vtt = _build_video_mocks(
+        [black_frame],
+        [("00:00:00.000", "Caption 1"), ("00:01:00.000", "Caption 2")],
+        fps=10.0,
+    )
+
+    with _patch_extraction(mock_video, mock_vtt, MagicMock(return_value=0.5)):
+        segments = extract_frames_from_video(
+            "video.mp4", subtitle_path, str(tmp_path), ImageOptions(format="jpg")
         )
 
-        (subtitle_dir / "sequence_2.webvtt").write_text(
-            "WEBVTT\n\n"
-            "00:00:11.074 --> 00:00:13.277 align:center line:79%\n"
-            "Accessibility empowers everyone\n"
-            "to experience\n\n"
-            "00:00:13.277 --> 00:00:15.379 align:center line:81%\n"
-            "and love the apps that you create.\n\n"
+    mock_video.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, 600)
+    assert mock_video.grab.call_count == 2
+    assert [segment.text for segment in segments] == ["Caption 1", "Caption 2"]
+
+
+def test_extract_frames_with_encode_executor(
+    tmp_path: Path,
+    subtitle_path: str,
+    monkeypatch: pytest.MonkeyPatch,
+    black_frame: np.ndarray,
+    white_frame: np.ndarray,
+):
+    """Test that frames encoded in an executor are all written, resized."""
+    monkeypatch.setattr(video, "MAX_PENDING_ENCODES", 1)
+    mock_video, mock_vtt = _build_video_mocks(
+        [black_frame, white_frame, black_frame, white_frame],
+        [(f"00:00:0{i}.000", f"Caption {i}") for i in range(4)],
+        fps=10.0,
+    )
+
+    with (
+        patch("wwdcdigest.video.cv2.VideoCapture", return_value=mock_video),
+        patch("wwdcdigest.video.webvtt") as mock_webvtt,
+        patch("wwdcdigest.video._signature_similarity", MagicMock(return_value=0.5)),
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        mock_webvtt.read.return_value = mock_vtt
+        segments = extract_frames_from_video(
+            "video.mp4",
+            subtitle_path,
+            str(tmp_path),
+            ImageOptions(format="png", width=4),
+            executor,
         )
 
-        (subtitle_dir / "sequence_3.webvtt").write_text(
-            "WEBVTT\n\n"
-            "00:00:16.313 --> 00:00:18.348 align:center line:79%\n"
-            "Today I'm going to go beyond\n"
-            "the basics to explore\n\n"
-            "00:00:16.313 --> 00:00:18.348 align:center line:79%\n"
-            "Today I'm going to go beyond\n"
-            "the basics to explore\n\n"
-            "00:00:18.348 --> 00:00:20.584 align:center line:79%\n"
-            "how you can make your Mac app\n"
-            "more accessible.\n\n"
+    # Every segment's frame is on disk, resized before it was submitted
+    assert len(segments) == 4
+    for segment in segments:
+        image = cv2.imread(segment.image_path)
+        assert image is not None
+        assert image.shape[:2] == (4, 4)
+
+
+def test_grab_target_frames_raises_encode_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, black_frame: np.ndarray
+):
+    """Test that an error encoding a frame in the executor is raised."""
+    monkeypatch.setattr(video, "MAX_PENDING_ENCODES", 1)
+    mock_video, _ = _build_video_mocks([black_frame], [])
+    targets = [(0, 0, "00:00:00.000", "Caption 1"), (10, 1, "00:00:01.000", "2")]
+
+    with (
+        patch("wwdcdigest.video._save_frame_image", side_effect=OSError("disk full")),
+        patch("wwdcdigest.video._signature_similarity", MagicMock(return_value=0.5)),
+        ThreadPoolExecutor(max_workers=1) as executor,
+        pytest.raises(OSError, match="disk full"),
+    ):
+        _grab_target_frames(
+            mock_video, targets, str(tmp_path), ImageOptions(format="jpg"), executor
         )
 
-        # Test combining subtitles
-        output_dir = Path(temp_dir) / "output"
-        output_dir.mkdir()
 
-        combined_path = prepare_subtitle_path(str(subtitle_dir), str(output_dir))
+def test_get_encode_executor_avoids_fork(monkeypatch: pytest.MonkeyPatch):
+    """Test that encoding processes are not forked from the threaded parent."""
+    monkeypatch.setattr(video, "_encode_executor", None)
 
-        # Check that the combined file exists
-        assert os.path.exists(combined_path)
+    with patch("wwdcdigest.video.ProcessPoolExecutor") as mock_pool:
+        assert get_encode_executor() is mock_pool.return_value
 
-        # Read the combined file
-        with open(combined_path, encoding="utf-8") as f:
-            content = f.read()
+    context = mock_pool.call_args.kwargs["mp_context"]
+    assert context.get_start_method() in ("forkserver", "spawn")
 
-        # Count the number of occurrences of each unique caption
-        assert (
-            content.count(
-                "00:00:11.074 --> 00:00:13.277 align:center line:79%\n"
-                "Accessibility empowers everyone\n"
-                "to experience"
-            )
-            == 1
-        )
 
-        assert (
-            content.count(
-                "00:00:16.313 --> 00:00:18.348 align:center line:79%\n"
-                "Today I'm going to go beyond\n"
-                "the basics to explore"
-            )
-            == 1
+def test_get_encode_executor_falls_back_to_threads(monkeypatch: pytest.MonkeyPatch):
+    """Test that frames are encoded in threads without worker processes."""
+    monkeypatch.setattr(video, "_encode_executor", None)
+
+    with patch("wwdcdigest.video.ProcessPoolExecutor", side_effect=NotImplementedError):
+        executor = get_encode_executor()
+
+    assert isinstance(executor, ThreadPoolExecutor)
+    executor.shutdown()
+
+
+def test_save_frame_image_pickles(black_frame: np.ndarray):
+    """Test that the encoding worker and its arguments can be sent to a process."""
+    job = (_save_frame_image, black_frame, "frame.avif", ImageOptions(format="avif"))
+    assert pickle.loads(pickle.dumps(job))[0] is _save_frame_image
+
+
+def testprepare_subtitle_path(tmp_path: Path):
+    """Test preparing subtitle path with multiple files."""
+    # Create a mock subtitle directory with multiple .webvtt files
+    subtitle_dir = tmp_path / "subtitles"
+    subtitle_dir.mkdir()
+
+    # Create multiple subtitle files
+    (subtitle_dir / "part1.webvtt").write_text(
+        "WEBVTT\n\n1\n00:00:10.000 --> 00:00:15.000\nPart 1"
+    )
+    (subtitle_dir / "part2.webvtt").write_text(
+        "WEBVTT\n\n2\n00:00:20.000 --> 00:00:25.000\nPart 2"
+    )
+
+    # Test combining subtitles
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    combined_path = prepare_subtitle_path(str(subtitle_dir), str(output_dir))
+
+    # Check that the combined file exists and contains both parts
+    assert os.path.exists(combined_path)
+    with open(combined_path, encoding="utf-8") as f:
+        content = f.read()
+        assert "Part 1" in content
+        assert "Part 2" in content
+
+
+# Subtitle files with captions duplicated within and across files
+_SEQUENCE_VTT_FILES = {
+    "sequence_1.webvtt": (
+        b"WEBVTT\n\n"
+        b"00:00:06.904 --> 00:00:10.374 align:center line:79%\n"
+        b"Hello, I'm Nicholas,\n"
+        b"an engineer on the Accessibility team.\n\n"
+        b"00:00:11.074 --> 00:00:13.277 align:center line:79%\n"
+        b"Accessibility empowers everyone\n"
+        b"to experience\n\n"
+    ),
+    "sequence_2.webvtt": (
+        b"WEBVTT\n\n"
+        b"00:00:11.074 --> 00:00:13.277 align:center line:79%\n"
+        b"Accessibility empowers everyone\n"
+        b"to experience\n\n"
+        b"00:00:13.277 --> 00:00:15.379 align:center line:81%\n"
+        b"and love the apps that you create.\n\n"
+    ),
+    "sequence_3.webvtt": (
+        b"WEBVTT\n\n"
+        b"00:00:16.313 --> 00:00:18.348 align:center line:79%\n"
+        b"Today I'm going to go beyond\n"
+        b"the basics to explore\n\n"
+        b"00:00:16.313 --> 00:00:18.348 align:center line:79%\n"
+        b"Today I'm going to go beyond\n"
+        b"the basics to explore\n\n"
+        b"00:00:18.348 --> 00:00:20.584 align:center line:79%\n"
+        b"how you can make your Mac app\n"
+        b"more accessible.\n\n"
+    ),
+}
+
+
+def testprepare_subtitle_path_deduplicates_captions(tmp_path: Path):
+    """Test that duplicate captions are removed when combining subtitle files."""
+    # Create a mock subtitle directory with multiple .webvtt files
+    subtitle_dir = tmp_path / "subtitles"
+    subtitle_dir.mkdir()
+
+    # Create subtitle files with duplicate content
+    for name, content in _SEQUENCE_VTT_FILES.items():
+        (subtitle_dir / name).write_bytes(content)
+
+    # Test combining subtitles
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    combined_path = prepare_subtitle_path(str(subtitle_dir), str(output_dir))
+
+    # Check that the combined file exists
+    assert os.path.exists(combined_path)
+
+    # Read the combined file
+    with open(combined_path, encoding="utf-8") as f:
+        content = f.read()
+
+    # Count the number of occurrences of each unique caption
+    assert (
+        content.count(
+            "00:00:11.074 --> 00:00:13.277 align:center line:79%\n"
+            "Accessibility empowers everyone\n"
+            "to experience"
         )
+        == 1
+    )
 
-        # Check that all expected captions are present exactly once
-        expected_captions = [
-            "Hello, I'm Nicholas,\nan engineer on the Accessibility team.",
-            "Accessibility empowers everyone\nto experience",
-            "and love the apps that you create.",
-            "Today I'm going to go beyond\nthe basics to explore",
-            "how you can make your Mac app\nmore accessible.",
-        ]
-
-        for caption in expected_captions:
-            assert caption in content, f"Caption not found: {caption}"
-
-
-@pytest.mark.anyio
-async def test_delete_unused_image_files():
-    """Test deleting unused image files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create test image files
-        test_files = []
-        for i in range(3):
-            file_path = os.path.join(temp_dir, f"test_image_{i}.jpg")
-            # Create an empty file
-            with open(file_path, "w") as f:
-                f.write("")
-            test_files.append(file_path)
-
-        # Make sure files exist
-        for file_path in test_files:
-            assert os.path.exists(file_path)
-
-        # Delete the files
-        delete_unused_image_files(test_files)
-
-        # Verify files are deleted
-        for file_path in test_files:
-            assert not os.path.exists(file_path)
-
-        # Test with non-existent files (should not raise exception)
-        non_existent_file = os.path.join(temp_dir, "non_existent.jpg")
-        delete_unused_image_files([non_existent_file])
-
-
-@pytest.mark.anyio
-async def test_image_format_options():
+    assert (
+        content.count(
+            "00:00:16.313 --> 00:00:18.348 align:center line:79%\n"
+            "Today I'm going to go beyond\n"
+            "the basics to explore"
+        )
+        == 1
+    )
+
+    # Check that all expected captions are present exactly once
+    expected_captions = [
+        "Hello, I'm Nicholas,\nan engineer on the Accessibility team.",
+        "Accessibility empowers everyone\nto experience",
+        "and love the apps that you create.",
+        "Today I'm going to go beyond\nthe basics to explore",
+        "how you can make your Mac app\nmore accessible.",
+    ]
+
+    for caption in expected_captions:
+        assert caption in content, f"Caption not found: {caption}"
+
+
+@pytest.mark.parametrize("fmt", ["jpg", "png", "avif", "webp"])
+def test_image_format_options(
+    subtitle_path: str,
+    black_frame: np.ndarray,
+    fmt: Literal["jpg", "png", "avif", "webp"],
+):
     """Test that different image formats are supported."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a real temporary subtitle file
-        subtitle_path = os.path.join(temp_dir, "subtitle.vtt")
-        with open(subtitle_path, "w", encoding="utf-8") as f:
-            f.write("WEBVTT\n\n")
-
-        video_path = "video.mp4"  # This will be mocked
-        output_dir = temp_dir
-
-        # Create a test frame
-        frame = np.zeros((100, 100, 3), dtype=np.uint8)
-
-        # Test different image formats
-        formats: list[Literal["jpg", "png", "avif", "webp"]] = [
-            "jpg",
-            "png",
-            "avif",
-            "webp",
-        ]
-
-        for fmt in formats:
-            # Create a mock for cv2.VideoCapture for each format
-            mock_video = MagicMock()
-            mock_video.isOpened.return_value = True
-            mock_video.get.return_value = 30.0  # fps
-
-            # Set up read to return our frame and then False for end of video
-            mock_video.read.side_effect = [(True, frame), (False, None)]
-
-            # Mock WebVTT data
-            mock_caption = MagicMock(start="00:00:10.000", text="Test Caption")
-            mock_vtt = MagicMock()
-            mock_vtt.__iter__.return_value = [mock_caption]
-
-            # Create a mock for _save_frame_image that does nothing
-            def mock_save_frame(
-                frame: np.ndarray, path: str, image_options: "ImageOptions"
-            ) -> None:
-                pass
-
-            # Patch dependencies
-            with (
-                patch("wwdcdigest.video.cv2.VideoCapture", return_value=mock_video),
-                patch("wwdctools.combine_webvtt_files", return_value=None),
-                patch("wwdcdigest.video.webvtt.read", return_value=mock_vtt),
-                patch("wwdcdigest.video.compare_images", return_value=0.5),
-                patch(
-                    "wwdcdigest.video._save_frame_image", side_effect=mock_save_frame
-                ) as mock_save,
-                # Add a patch for vtt.captions to ensure it's properly accessible
-                patch.object(mock_vtt, "captions", [mock_caption]),
-            ):
-                # Call the function with the current format using ImageOptions
-                from wwdcdigest.models import ImageOptions
-
-                image_options = ImageOptions(format=fmt)
-                segments = extract_frames_from_video(
-                    video_path, subtitle_path, output_dir, image_options
-                )
-
-                # Check that the save function was called with the right format
-                # We need to adapt this assertion to match the new signature
-                mock_save.assert_called_once()
-                args, _ = mock_save.call_args
-                assert args[0] is frame  # Check frame is the same
-                assert args[1] == os.path.join(
-                    output_dir, f"frame_0000.{fmt}"
-                )  # Check path
-                assert args[2].format == fmt  # Check format in ImageOptions
-
-                # Check that we got the segment
-                assert len(segments) == 1
-                assert segments[0].text == "Test Caption"
-                assert segments[0].image_path.endswith(f".{fmt}")
+    output_dir = os.path.dirname(subtitle_path)
+    mock_video, mock_vtt = _build_video_mocks(
+        [black_frame], [("00:00:10.000", "Test Caption")]
+    )
+
+    with _patch_extraction(
+        mock_video, mock_vtt, MagicMock(return_value=0.5)
+    ) as mock_save:
+        segments = extract_frames_from_video(
+            "video.mp4", subtitle_path, output_dir, ImageOptions(format=fmt)
+        )
+
+    # Check that the save function was called with the right format
+    mock_save.assert_called_once()
+    args, _ = mock_save.call_args
+    assert args[0] is black_frame  # Check frame is the same
+    assert args[1] == os.path.join(output_dir, f"frame_0000.{fmt}")  # Check path
+    assert args[2].format == fmt  # Check format in ImageOptions
+
+    # Check that we got the segment
+    assert len(segments) == 1
+    assert segments[0].text == "Test Caption"
+    assert segments[0].image_path.endswith(f".{fmt}")
+
+
+def test_load_segments_from_frames_dir(tmp_path: Path):
+    """Test that frame images are loaded in frame number order."""
+    for name in [
+        "frame_10000.avif",
+        "frame_0002.jpg",
+        "Frame_0001.PNG",
+        "metadata.txt",
+        "frame_abc.jpg",
+        "combined.vtt",
+    ]:
+        (tmp_path / name).write_bytes(b"")
+
+    segments = load_segments_from_frames_dir(str(tmp_path))
+
+    assert [os.path.basename(segment.image_path) for segment in segments] == [
+        "Frame_0001.PNG",
+        "frame_0002.jpg",
+        "frame_10000.avif",
+    ]
+    assert segments[0].text == "Frame 0001"
+
+
+def test_load_segments_from_missing_frames_dir(tmp_path: Path):
+    """Test that a missing frames directory yields no segments."""
+    assert load_segments_from_frames_dir(str(tmp_path / "frames")) == []
+
+
+def test_load_segments_uses_metadata_text(tmp_path: Path):
+    """Test that caption text is read from metadata.txt when present."""
+    (tmp_path / "frame_0001.jpg").write_bytes(b"")
+    (tmp_path / "frame_0002.jpg").write_bytes(b"")
+    (tmp_path / "metadata.txt").write_text(
+        "Frame: 0001\n  First line\nSecond line\n\nFrame: 0002\n",
+        encoding="utf-8",
+    )
+
+    segments = load_segments_from_frames_dir(str(tmp_path))
+
+    assert [segment.text for segment in segments] == [
+        "First line\nSecond line",
+        "Frame 0002",
+    ]
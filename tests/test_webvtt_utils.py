@@ -107,6 +107,32 @@ to experience
     assert "Accessibility empowers everyone\nto experience" in texts
 
 
+def _caption_texts(path: str) -> list[str]:
+    """Read the text of every caption in a WebVTT file."""
+    return [c.text.strip() for c in webvtt.read(path).captions]
+
+
+def test_prepare_combined_subtitle_single_file_keeps_unique_cues(
+    tmp_path: Path,
+) -> None:
+    """Test that combining a single file without repeated cues keeps every cue."""
+    sample_vtt_path = tmp_path / "sample.vtt"
+    sample_vtt_path.write_text(
+        "WEBVTT\n\n00:00:06.904 --> 00:00:10.374\nHello, I'm Nicholas,\n"
+        "an engineer on the Accessibility team.\n\n"
+        "00:00:11.074 --> 00:00:13.277\nAccessibility empowers everyone\n"
+        "to experience\n\n"
+        "00:00:13.277 --> 00:00:15.379\nand love the apps that you create.\n",
+        encoding="utf-8",
+    )
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    combined_path = prepare_combined_subtitle(str(sample_vtt_path), str(output_dir))
+
+    assert _caption_texts(combined_path) == _caption_texts(str(sample_vtt_path))
+
+
 def test_prepare_combined_subtitle_directory(tmp_path: Path) -> None:
     """Test preparing a combined subtitle from a directory of files."""
     # Create a directory with multiple WebVTT files